@@ -34,6 +34,10 @@ class AppSettings:
     DEFAULT_SLEEP_TIME = 10  # seconds between API calls
     DEFAULT_CHUNK_SIZE = 50  # lines per translation chunk
     MAX_RETRIES = 3
+    AUTO_TRANSLATE_WORKERS = 3  # files translated concurrently by auto-translate
+    # API calls in flight at once; each slot waits sleep_time between its own
+    # calls, so raising this multiplies the request rate
+    MAX_CONCURRENT_REQUESTS = 1
 
     # Target columns for translation results
     CSV_TARGET_COLUMNS = [
@@ -48,6 +52,7 @@ class AppSettings:
     WINDOW_WIDTH = 1200
     WINDOW_HEIGHT = 800
     TABLE_MIN_HEIGHT = 600
+    TABLE_ROW_HEIGHT = 24
     CELL_DETAIL_HEIGHT = 50
     STATUS_HEIGHT = 50
 
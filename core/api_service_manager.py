@@ -216,6 +216,21 @@ class APIServiceManager:
         """Check if service has API key configured"""
         return service_id in self.api_keys and bool(self.api_keys[service_id])
     
+    def get_all_api_keys(self) -> Dict[str, str]:
+        """
+        Get decrypted API keys for every service that has one
+        
+        Returns:
+            Dictionary of service_id -> decrypted API key
+        """
+        keys = {}
+        for service_id, encrypted_key in self.api_keys.items():
+            if encrypted_key:
+                api_key = self.encryption_manager.decrypt(encrypted_key)
+                if api_key:
+                    keys[service_id] = api_key
+        return keys
+    
     def test_service(
         self, 
         service_id: str, 
@@ -3,6 +3,7 @@ Improved file manager with optimizations and better error handling
 """
 
 import os
+import numpy as np
 import pandas as pd
 import asyncio
 import aiofiles
@@ -12,6 +13,7 @@ from pathlib import Path
 import time
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from dataclasses import dataclass
 from io import StringIO
 
@@ -112,7 +114,7 @@ class OptimizedFileManager:
         """Discover CSV files asynchronously"""
 
         def _scan_directory():
-            return [f for f in os.listdir(directory) if f.lower().endswith(".csv")]
+            return list(FileUtils.iter_csv_files(directory))
 
         return await asyncio.get_event_loop().run_in_executor(
             self.executor, _scan_directory
@@ -283,6 +285,8 @@ class OptimizedFileManager:
                     error_code="FILE_SAVE_ERROR",
                 )
 
+        except OSError:
+            raise
         except Exception as e:
             self.logger.error(f"Error saving file {output_filename}: {e}")
             return ProcessingResult(
@@ -309,11 +313,22 @@ class OptimizedFileManager:
         try:
 
             def _save():
-                dataframe.to_csv(file_path, index=False, encoding="utf-8")
+                # Serialize in row blocks so only one block's text is buffered
+                dataframe.to_csv(
+                    file_path,
+                    index=False,
+                    encoding="utf-8",
+                    mode="w",
+                    chunksize=self.chunk_size,
+                )
                 return True
 
             return await asyncio.get_event_loop().run_in_executor(self.executor, _save)
 
+        except OSError as e:
+            # Callers report the failed write's own reason (permissions, ...)
+            self.logger.error(f"Error saving CSV to {file_path}: {e}")
+            raise
         except Exception as e:
             self.logger.error(f"Error saving CSV to {file_path}: {e}")
             return False
@@ -383,6 +398,44 @@ class OptimizedFileManager:
 
         return chunks
 
+    def apply_translation_chunks(
+        self,
+        dataframe: pd.DataFrame,
+        translated_chunks: List[TranslationChunk],
+        target_column: str,
+    ) -> pd.DataFrame:
+        """
+        Write translated chunk texts into target_column with one assignment
+
+        Rows come from the "line" numbers of chunks built by
+        prepare_optimized_translation_chunks, or start_row + position for
+        plain text chunks. The DataFrame is updated in place and returned.
+        """
+        chunks = [c for c in translated_chunks if c.translated_texts]
+        if not chunks:
+            return dataframe
+
+        rows = np.fromiter(
+            (
+                item["line"] - 1 if isinstance(item, dict) else chunk.start_row + j
+                for chunk in chunks
+                for j, item in enumerate(
+                    chunk.original_texts[: len(chunk.translated_texts)]
+                )
+            ),
+            dtype=np.int64,
+        )
+        values = list(
+            chain.from_iterable(
+                c.translated_texts[: len(c.original_texts)] for c in chunks
+            )
+        )
+
+        if target_column not in dataframe.columns:
+            dataframe[target_column] = ""
+        dataframe.loc[rows, target_column] = values
+        return dataframe
+
     def _update_stats(self, operation: str, count: int, processing_time: float):
         """Update processing statistics"""
         if operation == "files_discovered":
@@ -582,13 +635,19 @@ class OptimizedFileManager:
 
         Returns:
             True if successful, False otherwise
+
+        Raises:
+            OSError: if the file could not be written
         """
+        loop = asyncio.new_event_loop()
         try:
-            loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.save_file_async(file_path, dataframe))
-            loop.close()
+            result = loop.run_until_complete(self.save_file_async(dataframe, file_path))
             return result.success
+        except OSError:
+            raise
         except Exception as e:
             self.logger.error(f"Error saving file: {e}")
             return False
+        finally:
+            loop.close()
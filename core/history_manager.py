@@ -7,7 +7,7 @@ import time
 from typing import List, Dict, Any, Optional
 from dataclasses import asdict
 
-from models.data_structures import HistoryEntry, ChatHistory, ChatMessage
+from models.data_structures import ChatHistory, ChatMessage
 from utils.file_utils import ConfigManager
 
 
@@ -30,27 +30,11 @@ class HistoryManager:
         """Add a user message to the chat history"""
         self.chat_history.add_message("human", content)
 
-        # Also add to legacy format for compatibility
-        entry = HistoryEntry(
-            role="user",
-            parts=[content],
-            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-            context_data=context_data or {},
-        )
-
     def add_ai_message(self, content: str, model_name: str = ""):
         """Add an AI response message to the chat history"""
         self.chat_history.add_message("ai", content)
         self.chat_history.model_name = model_name
 
-        # Also add to legacy format for compatibility
-        entry = HistoryEntry(
-            role="assistant",
-            parts=[content],
-            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-            model_name=model_name,
-        )
-
     def add_translation_entry(
         self,
         original_texts: List[str],
@@ -3,12 +3,34 @@ Project state management for CSV Translator
 Handles project-level settings and workspace state
 """
 
+import io
 import json
 import os
+import shutil
+import tempfile
+import zipfile
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+# Entries inside the zipped project file
+_PROJECT_ENTRY = "project.json"
+_DATA_DIR = "data/"
+
+
+def _feather_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame as zstd-compressed Feather"""
+    buffer = io.BytesIO()
+    feather.write_feather(df, buffer, compression="zstd")
+    return buffer.getvalue()
+
 
 class ProjectManager:
     """
@@ -20,6 +42,8 @@ class ProjectManager:
         self.current_path: Optional[str] = None
         self.state: Dict[str, Any] = {}
         self.is_dirty: bool = False
+        # Source CSV path -> {"entry", "mtime_ns"} for tables stored in the project
+        self._data_files: Dict[str, Dict[str, Any]] = {}
         self._default_state = self._get_default_state()
 
     def _get_default_state(self) -> Dict[str, Any]:
@@ -93,8 +117,13 @@ class ProjectManager:
 
         return self.current_path
 
-    def save(self, path: Optional[str] = None) -> bool:
-        """Save project state to file"""
+    def save(
+        self,
+        path: Optional[str] = None,
+        frames: Optional[Dict[str, pd.DataFrame]] = None,
+        shadows: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> bool:
+        """Save project state, and optionally loaded tables, to file"""
         try:
             save_path = path or self.current_path
             if not save_path:
@@ -107,10 +136,32 @@ class ProjectManager:
             project_path = Path(save_path)
             project_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Save to file
-            with open(save_path, "w", encoding="utf-8") as f:
-                json.dump(self.state, f, ensure_ascii=False, indent=2)
-
+            # Save to file: project.json plus one Feather blob per table,
+            # keyed by the source CSV so opening skips re-parsing it. A table
+            # may also carry its lowercase search shadow, saved alongside so
+            # the first case-insensitive find after opening is not cold.
+            # The archive is built beside the target and swapped in, so a
+            # failed save leaves the previous project file intact
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f"{project_path.name}.", suffix=".tmp", dir=project_path.parent
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as archive:
+                        data_files = self._write_archive(
+                            archive, frames or {}, shadows or {}
+                        )
+                if project_path.exists():
+                    shutil.copymode(project_path, tmp_path)
+                os.replace(tmp_path, save_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+            self._data_files = data_files
             self.current_path = save_path
             self.is_dirty = False
             return True
@@ -119,14 +170,59 @@ class ProjectManager:
             print(f"Error saving project: {e}")
             return False
 
+    def _write_archive(
+        self,
+        archive: zipfile.ZipFile,
+        frames: Dict[str, pd.DataFrame],
+        shadows: Dict[str, pd.DataFrame],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Write project.json and table blobs; returns the data file index"""
+        data_files = {}
+        if frames and feather is not None:
+            for index, (file_path, df) in enumerate(frames.items()):
+                try:
+                    data = _feather_bytes(df)
+                    mtime_ns = os.stat(file_path).st_mtime_ns
+                except (OSError, ValueError, TypeError) as e:
+                    print(f"Skipping table {file_path} in project: {e}")
+                    continue
+                entry = f"{_DATA_DIR}{index}.feather"
+                # Feather is already compressed
+                archive.writestr(entry, data, compress_type=zipfile.ZIP_STORED)
+                info = {"entry": entry, "mtime_ns": mtime_ns}
+
+                shadow = shadows.get(file_path)
+                if shadow is not None and not shadow.empty:
+                    try:
+                        data = _feather_bytes(shadow)
+                    except (ValueError, TypeError) as e:
+                        print(f"Skipping search shadow for {file_path}: {e}")
+                    else:
+                        shadow_entry = f"{_DATA_DIR}{index}.lower.feather"
+                        archive.writestr(
+                            shadow_entry, data, compress_type=zipfile.ZIP_STORED
+                        )
+                        info["shadow_entry"] = shadow_entry
+                data_files[str(file_path)] = info
+
+        meta = dict(self.state, data_files=data_files)
+        archive.writestr(_PROJECT_ENTRY, json.dumps(meta, ensure_ascii=False, indent=2))
+        return data_files
+
     def load(self, path: str) -> bool:
         """Load project state from file"""
         try:
             if not os.path.exists(path):
                 raise FileNotFoundError(f"Project file not found: {path}")
 
-            with open(path, "r", encoding="utf-8") as f:
-                loaded_state = json.load(f)
+            if zipfile.is_zipfile(path):
+                with zipfile.ZipFile(path) as archive:
+                    loaded_state = json.loads(archive.read(_PROJECT_ENTRY))
+            else:
+                # Plain JSON project files from older versions
+                with open(path, "r", encoding="utf-8") as f:
+                    loaded_state = json.load(f)
+            self._data_files = loaded_state.pop("data_files", None) or {}
 
             # Merge with default state to ensure all keys exist
             self.state = self._get_default_state()
@@ -140,6 +236,30 @@ class ProjectManager:
             print(f"Error loading project: {e}")
             return False
 
+    def load_frame(self, file_path: str) -> Optional[pd.DataFrame]:
+        """Get a table stored in the project if its source CSV is unchanged"""
+        return self._read_data_entry(file_path, "entry")
+
+    def load_shadow(self, file_path: str) -> Optional[pd.DataFrame]:
+        """Get the lowercase search shadow stored with a table, if any"""
+        return self._read_data_entry(file_path, "shadow_entry")
+
+    def _read_data_entry(self, file_path: str, key: str) -> Optional[pd.DataFrame]:
+        """Read a Feather entry recorded for a source CSV"""
+        info = self._data_files.get(str(file_path))
+        if not info or key not in info or feather is None or not self.current_path:
+            return None
+
+        try:
+            if os.stat(file_path).st_mtime_ns != info["mtime_ns"]:
+                return None
+            with zipfile.ZipFile(self.current_path) as archive:
+                data = archive.read(info[key])
+            return feather.read_table(io.BytesIO(data)).to_pandas()
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            print(f"Error loading table from project: {e}")
+            return None
+
     def update_state(self, updates: Dict[str, Any]) -> None:
         """Update project state and mark as dirty"""
         self.state.update(updates)
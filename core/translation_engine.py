@@ -6,7 +6,8 @@ import json
 import re
 import time
 import asyncio
-from typing import List, Dict, Any, Optional, Callable
+import threading
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import asdict
 
 from langchain.schema import HumanMessage, SystemMessage
@@ -53,9 +54,12 @@ class TranslationEngine:
     def __init__(self):
         self.api_keys: Dict[str, str] = {}
         self.models: Dict[str, Any] = {}
-        self.custom_models: List[CustomModel] = []
+        # (provider, model_name) -> model, in the order they were added
+        self.custom_models: Dict[Tuple[ModelProvider, str], CustomModel] = {}
         self.chat_history: List[Dict[str, Any]] = []
         self.history: List[HistoryEntry] = []  # Add missing history attribute
+        # translate_chunk may run on several worker threads at once
+        self._history_lock = threading.Lock()
         self.translation_count = 0
 
         # Translation workflow graph
@@ -108,16 +112,10 @@ class TranslationEngine:
 
     def add_custom_model(self, custom_model: CustomModel):
         """Add a custom model configuration"""
-        # Remove existing model with same name and provider
-        self.custom_models = [
-            m
-            for m in self.custom_models
-            if not (
-                m.provider == custom_model.provider
-                and m.model_name == custom_model.model_name
-            )
-        ]
-        self.custom_models.append(custom_model)
+        # Replace any existing model with same name and provider
+        key = (custom_model.provider, custom_model.model_name)
+        self.custom_models.pop(key, None)
+        self.custom_models[key] = custom_model
 
         # Initialize the model
         self._initialize_custom_model(custom_model)
@@ -517,24 +515,26 @@ Input data:
                 {"translation": translated_texts}, ensure_ascii=False
             )
 
-            # Add to history
-            self.history.append(
-                HistoryEntry(
-                    role="user",
-                    parts=[user_message],
-                    timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-                    model_name="",
+            # Add to history; both entries go in together
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            with self._history_lock:
+                self.history.append(
+                    HistoryEntry(
+                        role="user",
+                        parts=[user_message],
+                        timestamp=timestamp,
+                        model_name="",
+                    )
                 )
-            )
 
-            self.history.append(
-                HistoryEntry(
-                    role="model",
-                    parts=[result_json],
-                    timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-                    model_name="",
+                self.history.append(
+                    HistoryEntry(
+                        role="model",
+                        parts=[result_json],
+                        timestamp=timestamp,
+                        model_name="",
+                    )
                 )
-            )
 
         except Exception as e:
             print(f"Error updating history: {e}")
@@ -640,16 +640,19 @@ Input data:
 
     def get_history(self) -> List[HistoryEntry]:
         """Get translation history"""
-        return self.history.copy()
+        with self._history_lock:
+            return self.history.copy()
 
     def clear_history(self):
         """Clear translation history"""
-        self.history.clear()
+        with self._history_lock:
+            self.history.clear()
 
     def save_history(self, file_path: str) -> bool:
         """Save history to file"""
         try:
-            history_data = [asdict(entry) for entry in self.history]
+            with self._history_lock:
+                history_data = [asdict(entry) for entry in self.history]
             with open(file_path, "w", encoding="utf-8") as f:
                 json.dump(history_data, f, ensure_ascii=False, indent=2)
             return True
@@ -6,7 +6,6 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple, Set
 from enum import Enum, auto
 import pandas as pd
-from pathlib import Path
 import time
 from datetime import datetime
 
@@ -158,6 +157,8 @@ class UndoRedoState:
     cell_position: Tuple[int, int] = None
     old_value: Any = None
     new_value: Any = None
+    # For single-column batch edits (old_value/new_value hold the value lists)
+    rows: List[int] = None
     # For bulk operations
     old_data: pd.DataFrame = None
     new_data: pd.DataFrame = None
@@ -300,7 +301,7 @@ class AppState:
     input_directory: str = ""
     output_directory: str = ""
     history_file: str = ""
-    csv_files: List[Path] = field(default_factory=list)
+    csv_files: List[str] = field(default_factory=list)  # absolute paths
     current_file_index: int = -1
     current_files: List[str] = field(default_factory=list)
     current_data: pd.DataFrame = None
@@ -310,7 +311,8 @@ class AppState:
     available_services: List[str] = field(default_factory=list)
     current_model_provider: ModelProvider = ModelProvider.OPENAI
     api_keys: Dict[str, str] = field(default_factory=dict)
-    custom_models: List[Any] = field(default_factory=list)
+    # model_name -> model, in the order they were added
+    custom_models: Dict[str, Any] = field(default_factory=dict)
     # Translation settings
     current_target_column: str = "Initial"
     chunk_size: int = 50
@@ -389,6 +391,14 @@ class AppState:
             return self.current_files[self.current_file_index]
         return ""
 
+    def add_custom_model(self, model: Any):
+        """Add or replace a custom model by name"""
+        self.custom_models[model.model_name] = model
+
+    def remove_custom_model(self, model_name: str):
+        """Remove a custom model by name"""
+        self.custom_models.pop(model_name, None)
+
     def add_summary(self, summary_data: Dict[str, Any]):
         """Add summary to history (max 3, remove oldest if full)"""
         self.summary_history.append(summary_data)
@@ -2,6 +2,10 @@
 Enhanced table model for CSV data with undo/redo and advanced features
 """
 
+from bisect import bisect_right
+from itertools import accumulate
+
+import numpy as np
 import pandas as pd
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
 from PyQt6.QtGui import QColor
@@ -11,11 +15,16 @@ import time
 from models.data_structures import UndoRedoState, UndoRedoAction, TableSelection
 
 
+# Joins the cells of a column into one buffer for ASCII search
+_RECORD_SEP = "\x1f"
+
+
 class EnhancedPandasModel(QAbstractTableModel):
     """Enhanced pandas model with undo/redo support and Excel-like features"""
 
     # Signals
     dataEdited = pyqtSignal(int, int, str, str)  # row, col, old_value, new_value
+    columnValuesEdited = pyqtSignal(int, int)  # col, number of cells written
     selectionChanged = pyqtSignal()
 
     def __init__(self, data=None, parent=None):
@@ -33,6 +42,11 @@ class EnhancedPandasModel(QAbstractTableModel):
 
         # Find/replace state
         self._search_term = ""
+        # Casefolded str copy of each searched column; dropped on edits
+        self._folded_columns = {}
+        # (col, case_sensitive) -> (ASCII bytes buffer, row offsets), or None
+        # for columns holding non-ASCII text; dropped with the folded columns
+        self._ascii_buffers = {}
         self._case_sensitive = False
         self._whole_words = False
 
@@ -125,10 +139,63 @@ class EnhancedPandasModel(QAbstractTableModel):
 
         return True
 
+    def setColumnValues(self, rows: List[int], col: int, values: List[Any]) -> bool:
+        """Write many cells of one column at once with a single dataChanged"""
+        if not rows or not 0 <= col < self.columnCount():
+            return False
+
+        old_values = self._data.iloc[rows, col].astype(str).tolist()
+        new_values = [str(value) for value in values]
+
+        undo_state = UndoRedoState(
+            action_type=UndoRedoAction.TRANSLATE,
+            cell_position=(min(rows), col),
+            old_value=old_values,
+            new_value=new_values,
+            rows=list(rows),
+            timestamp=time.strftime("%H:%M:%S"),
+            description=f"Translate {len(rows)} cells in {self._data.columns[col]}",
+        )
+        self._add_undo_state(undo_state)
+
+        self._apply_column_values(rows, col, values)
+        self._modified_cells.update((row, col) for row in rows)
+        self.columnValuesEdited.emit(col, len(rows))
+        return True
+
+    def _apply_column_values(self, rows, col, values):
+        """Assign values to rows of a column and refresh the spanned range"""
+        self._data.iloc[rows, col] = values
+        self.dataChanged.emit(self.index(min(rows), col), self.index(max(rows), col))
+
     def getDataFrame(self):
         """Get the current DataFrame"""
         return self._data.copy()
 
+    def getDataFrameView(self):
+        """Get the underlying DataFrame without copying (read-only use)"""
+        return self._data
+
+    def getSearchShadow(self) -> pd.DataFrame:
+        """Get the cached casefolded search columns, keyed by column number"""
+        return pd.DataFrame(
+            {
+                str(col): values.to_numpy()
+                for col, values in sorted(self._folded_columns.items())
+            }
+        )
+
+    def setSearchShadow(self, shadow: pd.DataFrame):
+        """Seed the casefolded search cache from a saved shadow"""
+        if len(shadow) != self.rowCount():
+            return
+        for name in shadow.columns:
+            col = int(name) if str(name).isdigit() else -1
+            if 0 <= col < self.columnCount():
+                self._folded_columns[col] = pd.Series(
+                    shadow[name].to_numpy(), index=self._data.index
+                )
+
     def setDataFrame(self, dataframe):
         """Set a new DataFrame"""
         self.beginResetModel()
@@ -146,6 +213,8 @@ class EnhancedPandasModel(QAbstractTableModel):
 
         self._data = dataframe.copy()
         self._original_data = dataframe.copy()
+        self._folded_columns.clear()
+        self._ascii_buffers.clear()
         self._modified_cells.clear()
         self._selected_indexes.clear()
         self._highlighted_cells.clear()
@@ -166,19 +235,24 @@ class EnhancedPandasModel(QAbstractTableModel):
 
     def highlightCells(self, cells: Set[Tuple[int, int]]):
         """Highlight specific cells (for search results)"""
-        old_highlighted = self._highlighted_cells.copy()
+        old_highlighted = self._highlighted_cells
         self._highlighted_cells = cells
 
-        # Emit dataChanged for affected cells
-        all_affected_positions = old_highlighted.union(self._highlighted_cells)
-        affected_indexes = [
-            self.index(row, col)
-            for row, col in all_affected_positions
-            if 0 <= row < self.rowCount() and 0 <= col < self.columnCount()
-        ]
-
-        if affected_indexes:
-            self._emit_data_changed_for_indexes(affected_indexes)
+        # One dataChanged over the bounding rect of old and new hits
+        all_affected_positions = old_highlighted | cells
+        if not all_affected_positions or self._data.empty:
+            return
+        rows = [row for row, _ in all_affected_positions]
+        cols = [col for _, col in all_affected_positions]
+        top_left = self.index(max(min(rows), 0), max(min(cols), 0))
+        bottom_right = self.index(
+            min(max(rows), self.rowCount() - 1), min(max(cols), self.columnCount() - 1)
+        )
+        self.dataChanged.emit(
+            top_left,
+            bottom_right,
+            [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole],
+        )
 
     def clearHighlights(self):
         """Clear all highlighted cells"""
@@ -207,8 +281,20 @@ class EnhancedPandasModel(QAbstractTableModel):
             bottom_right = self.index(max_row, max_col)
             self.dataChanged.emit(top_left, bottom_right)
 
+    def _invalidate_folded_columns(self, state: UndoRedoState):
+        """Drop cached search columns touched by an edit"""
+        if state.cell_position is not None:
+            col = state.cell_position[1]
+            self._folded_columns.pop(col, None)
+            self._ascii_buffers.pop((col, True), None)
+            self._ascii_buffers.pop((col, False), None)
+        else:
+            self._folded_columns.clear()
+            self._ascii_buffers.clear()
+
     def _add_undo_state(self, state: UndoRedoState):
         """Add an undo state"""
+        self._invalidate_folded_columns(state)
         self._undo_stack.append(state)
         if len(self._undo_stack) > self._max_undo_states:
             self._undo_stack.pop(0)
@@ -230,6 +316,7 @@ class EnhancedPandasModel(QAbstractTableModel):
 
         state = self._undo_stack.pop()
         self._redo_stack.append(state)
+        self._invalidate_folded_columns(state)
 
         if state.action_type == UndoRedoAction.EDIT_CELL:
             row, col = state.cell_position
@@ -238,6 +325,11 @@ class EnhancedPandasModel(QAbstractTableModel):
             index = self.index(row, col)
             self.dataChanged.emit(index, index)
 
+        elif state.rows is not None:
+            col = state.cell_position[1]
+            self._apply_column_values(state.rows, col, state.old_value)
+            self._modified_cells.difference_update((r, col) for r in state.rows)
+
         elif state.action_type in [UndoRedoAction.TRANSLATE, UndoRedoAction.PASTE_DATA]:
             if state.old_data is not None:
                 self.beginResetModel()
@@ -253,6 +345,7 @@ class EnhancedPandasModel(QAbstractTableModel):
 
         state = self._redo_stack.pop()
         self._undo_stack.append(state)
+        self._invalidate_folded_columns(state)
 
         if state.action_type == UndoRedoAction.EDIT_CELL:
             row, col = state.cell_position
@@ -261,6 +354,11 @@ class EnhancedPandasModel(QAbstractTableModel):
             index = self.index(row, col)
             self.dataChanged.emit(index, index)
 
+        elif state.rows is not None:
+            col = state.cell_position[1]
+            self._apply_column_values(state.rows, col, state.new_value)
+            self._modified_cells.update((r, col) for r in state.rows)
+
         elif state.action_type in [UndoRedoAction.TRANSLATE, UndoRedoAction.PASTE_DATA]:
             if state.new_data is not None:
                 self.beginResetModel()
@@ -297,23 +395,89 @@ class EnhancedPandasModel(QAbstractTableModel):
         if not search_term:
             return results
 
-        search_str = search_term if case_sensitive else search_term.lower()
+        # casefold() is idempotent, so an already-folded term is left unchanged
+        search_str = search_term if case_sensitive else search_term.casefold()
 
-        for row in range(self.rowCount()):
-            for col in range(self.columnCount()):
-                cell_value = str(self._data.iloc[row, col])
-                compare_value = cell_value if case_sensitive else cell_value.lower()
-
-                if whole_words:
-                    # Simple whole word matching
-                    if search_str == compare_value:
-                        results.append((row, col))
-                else:
-                    if search_str in compare_value:
-                        results.append((row, col))
+        if self._data.empty:
+            return results
 
+        # An ASCII term can use bytes.find over a whole column; the record
+        # separator must not appear in it or a hit could span two cells
+        ascii_term = None
+        if (
+            not whole_words
+            and search_str.isascii()
+            and _RECORD_SEP not in search_str
+        ):
+            ascii_term = search_str.encode("ascii")
+
+        # Match whole columns at once and read hits back in row-major order
+        masks = []
+        for col in range(self.columnCount()):
+            if ascii_term is not None:
+                mask = self._find_in_ascii_buffer(col, case_sensitive, ascii_term)
+                if mask is not None:
+                    masks.append(mask)
+                    continue
+            if case_sensitive:
+                values = self._data.iloc[:, col].astype(str)
+            else:
+                values = self._folded_columns.get(col)
+                if values is None:
+                    values = self._data.iloc[:, col].astype(str).str.casefold()
+                    self._folded_columns[col] = values
+            if whole_words:
+                # Simple whole word matching
+                masks.append((values == search_str).to_numpy())
+            else:
+                masks.append(values.str.contains(search_str, regex=False).to_numpy())
+
+        hits = np.argwhere(np.column_stack(masks))
+        results = list(zip(hits[:, 0].tolist(), hits[:, 1].tolist()))
         return results
 
+    def _find_in_ascii_buffer(
+        self, col: int, case_sensitive: bool, term: bytes
+    ) -> Optional[np.ndarray]:
+        """Row mask of cells containing term, or None for non-ASCII columns"""
+        key = (col, case_sensitive)
+        if key in self._ascii_buffers:
+            cached = self._ascii_buffers[key]
+        else:
+            if case_sensitive:
+                values = self._data.iloc[:, col].astype(str)
+            else:
+                values = self._folded_columns.get(col)
+                if values is None:
+                    values = self._data.iloc[:, col].astype(str).str.casefold()
+                    self._folded_columns[col] = values
+            texts = values.tolist()
+            joined = _RECORD_SEP.join(texts)
+            cached = None
+            if joined.isascii():
+                # Start offset of each cell inside the joined buffer
+                offsets = [0]
+                offsets.extend(accumulate(len(text) + 1 for text in texts[:-1]))
+                cached = (joined.encode("ascii"), offsets)
+            self._ascii_buffers[key] = cached
+
+        if cached is None:
+            return None
+
+        buffer, offsets = cached
+        mask = np.zeros(len(offsets), dtype=bool)
+        last_row = len(offsets) - 1
+        find = buffer.find
+        pos = find(term)
+        while pos != -1:
+            row = bisect_right(offsets, pos) - 1
+            mask[row] = True
+            if row == last_row:
+                break
+            # One hit per cell is enough; continue from the next cell
+            pos = find(term, offsets[row + 1])
+        return mask
+
     def replace(
         self,
         old_text: str,
@@ -393,54 +557,54 @@ class EnhancedPandasModel(QAbstractTableModel):
         """Copy selected cells to clipboard format"""
         if not selected_indexes:
             return ""
+        return self._copy_positions(
+            [(index.row(), index.column()) for index in selected_indexes]
+        )
 
-        # Group indexes by row for better organization
-        rows_data = {}
-        for index in selected_indexes:
-            row = index.row()
-            col = index.column()
-            if row not in rows_data:
-                rows_data[row] = {}
-            rows_data[row][col] = str(self._data.iloc[row, col])
-
+    def _copy_positions(self, positions) -> str:
+        """Build tab/newline separated text for a list of (row, col) cells"""
         # Find the range of selection
-        min_row = min(rows_data.keys())
-        max_row = max(rows_data.keys())
-        all_cols = set()
-        for row_data in rows_data.values():
-            all_cols.update(row_data.keys())
-        min_col = min(all_cols)
-        max_col = max(all_cols)
-
-        # Build the clipboard data
-        clipboard_rows = []
-        for row in range(min_row, max_row + 1):
-            row_cells = []
-            for col in range(min_col, max_col + 1):
-                if row in rows_data and col in rows_data[row]:
-                    row_cells.append(rows_data[row][col])
-                else:
-                    row_cells.append("")  # Empty cell for gaps
-            clipboard_rows.append("\t".join(row_cells))
-
-        return "\n".join(clipboard_rows)
+        rows = [row for row, _ in positions]
+        cols = [col for _, col in positions]
+        min_row, max_row = min(rows), max(rows)
+        min_col, max_col = min(cols), max(cols)
+
+        # Read the bounding block once; gaps in the selection become ""
+        block = (
+            self._data.iloc[min_row : max_row + 1, min_col : max_col + 1]
+            .astype(str)
+            .to_numpy()
+            .tolist()
+        )
+        if len(set(positions)) < len(block) * len(block[0]):
+            selected = set(positions)
+            block = [
+                [
+                    value if (row, col) in selected else ""
+                    for col, value in enumerate(row_values, min_col)
+                ]
+                for row, row_values in enumerate(block, min_row)
+            ]
+
+        return "\n".join("\t".join(row_values) for row_values in block)
 
     def cutSelectedData(self, selected_indexes) -> str:
         """Cut selected cells (copy + delete)"""
         if not selected_indexes:
             return ""
 
+        positions = [(index.row(), index.column()) for index in selected_indexes]
+
         # First copy the data
-        clipboard_data = self.copySelectedData(selected_indexes)
+        clipboard_data = self._copy_positions(positions)
 
         # Create undo state before deletion
         old_data = self._data.copy()
 
         # Delete the data
-        for index in selected_indexes:
-            row, col = index.row(), index.column()
+        for row, col in positions:
             self._data.iloc[row, col] = ""
-            self._modified_cells.add((row, col))
+        self._modified_cells.update(positions)
 
         # Add undo state
         undo_state = UndoRedoState(
@@ -448,13 +612,13 @@ class EnhancedPandasModel(QAbstractTableModel):
             old_data=old_data,
             new_data=self._data.copy(),
             timestamp=time.strftime("%H:%M:%S"),
-            description=f"Cut {len(selected_indexes)} cells",
-            affected_cells=set((idx.row(), idx.column()) for idx in selected_indexes),
+            description=f"Cut {len(positions)} cells",
+            affected_cells=set(positions),
         )
         self._add_undo_state(undo_state)
 
         # Emit data changed
-        self._emit_data_changed_for_indexes(selected_indexes)
+        self._emit_data_changed_for_indexes(set(positions))
 
         return clipboard_data
 
@@ -23,7 +23,7 @@ from PyQt6.QtWidgets import (
     QGridLayout,
     QFrame,
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QSignalBlocker
 from PyQt6.QtGui import QFont
 
 from config.settings import AppSettings
@@ -138,6 +138,7 @@ class ConfigPanel(QWidget):
     load_files_requested = pyqtSignal()
     custom_model_added = pyqtSignal(CustomModel)
     custom_model_removed = pyqtSignal(str)  # model name
+    state_applied = pyqtSignal()  # emitted once after apply_state
 
     def __init__(self):
         super().__init__()
@@ -489,3 +490,33 @@ class ConfigPanel(QWidget):
         index = self.target_column_combo.findText(column)
         if index >= 0:
             self.target_column_combo.setCurrentIndex(index)
+
+    def set_sleep_time(self, seconds: int):
+        """Set the sleep time"""
+        self.sleep_time_spin.setValue(seconds)
+
+    def set_chunk_size(self, size: int):
+        """Set the chunk size"""
+        self.chunk_size_spin.setValue(size)
+
+    def apply_state(
+        self,
+        input_directory: str,
+        output_directory: str,
+        history_file: str,
+        model_name: str,
+        target_column: str,
+        chunk_size: int,
+        sleep_time: int,
+    ):
+        """Set all controls at once, emitting only state_applied"""
+        with QSignalBlocker(self):
+            self.set_input_directory(input_directory)
+            self.set_output_directory(output_directory)
+            self.set_history_file(history_file)
+            self.set_current_model(model_name)
+            self.set_target_column(target_column)
+            self.set_chunk_size(chunk_size)
+            self.set_sleep_time(sleep_time)
+
+        self.state_applied.emit()
@@ -2,6 +2,8 @@
 Dialog components for the CSV Translator application
 """
 
+from operator import attrgetter
+
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -10,7 +12,8 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QCheckBox,
-    QTextEdit,
+    QRadioButton,
+    QButtonGroup,
     QGroupBox,
     QComboBox,
     QTabWidget,
@@ -19,15 +22,28 @@ from PyQt6.QtWidgets import (
     QInputDialog,
     QFormLayout,
     QSpinBox,
-    QListWidget,
-    QListWidgetItem,
-    QSplitter,
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from models.data_structures import ModelProvider
 
+_GOOGLE_KEY = ModelProvider.GOOGLE.value
+
+
+def _create_question_box(parent, title: str, text: str) -> QMessageBox:
+    """Create a Yes/No question box to be shown with open() instead of exec()"""
+    box = QMessageBox(parent)
+    box.setIcon(QMessageBox.Icon.Question)
+    box.setWindowTitle(title)
+    box.setText(text)
+    box.setStandardButtons(
+        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+    )
+    box.setDefaultButton(QMessageBox.StandardButton.No)
+    box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    return box
+
 
 class APIKeyDialog(QDialog):
     """Dialog for setting up API keys for different providers"""
@@ -82,13 +98,13 @@ class APIKeyDialog(QDialog):
         keys = {}
         google_key = self.google_key_edit.text().strip()
         if google_key:
-            keys[ModelProvider.GOOGLE.value] = google_key
+            keys[_GOOGLE_KEY] = google_key
         return keys
 
     def set_api_keys(self, keys):
         """Set existing API keys"""
-        if ModelProvider.GOOGLE.value in keys:
-            self.google_key_edit.setText(keys[ModelProvider.GOOGLE.value])
+        if _GOOGLE_KEY in keys:
+            self.google_key_edit.setText(keys[_GOOGLE_KEY])
 
 
 class FindReplaceDialog(QDialog):
@@ -97,11 +113,17 @@ class FindReplaceDialog(QDialog):
     # Signals
     find_next_requested = pyqtSignal(
         str, bool, bool
-    )  # text, case_sensitive, whole_words
+    )  # text (casefolded unless case_sensitive), case_sensitive, whole_words
     replace_requested = pyqtSignal(
         str, str, bool, bool, bool
     )  # find, replace, case, whole, selected_only
     replace_all_requested = pyqtSignal(str, str, bool, bool)  # old, new, case, whole
+    # Bracket replace_all_requested so receivers can batch view updates
+    replace_all_begin = pyqtSignal()
+    replace_all_end = pyqtSignal()
+
+    # Longer find texts are not auto-selected to avoid a costly relayout
+    _MAX_SELECT_LENGTH = 4096
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -181,9 +203,12 @@ class FindReplaceDialog(QDialog):
         """Find next occurrence"""
         text = self.find_edit.text()
         if text:
+            case_sensitive = self.case_sensitive_check.isChecked()
+            # Fold the needle once here so receivers only fold the cells
+            needle = text if case_sensitive else text.casefold()
             self.find_next_requested.emit(
-                text,
-                self.case_sensitive_check.isChecked(),
+                needle,
+                case_sensitive,
                 self.whole_words_check.isChecked(),
             )
 
@@ -207,26 +232,36 @@ class FindReplaceDialog(QDialog):
         replace_text = self.replace_edit.text()
 
         if find_text:
-            reply = QMessageBox.question(
+            case_sensitive = self.case_sensitive_check.isChecked()
+            whole_words = self.whole_words_check.isChecked()
+
+            # Ask asynchronously so no nested event loop blocks the UI
+            box = _create_question_box(
                 self,
                 "Replace All",
                 f"Replace all occurrences of '{find_text}' with '{replace_text}'?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
             )
 
-            if reply == QMessageBox.StandardButton.Yes:
-                self.replace_all_requested.emit(
-                    find_text,
-                    replace_text,
-                    self.case_sensitive_check.isChecked(),
-                    self.whole_words_check.isChecked(),
-                )
+            def on_finished(code: int):
+                if code != QMessageBox.StandardButton.Yes.value:
+                    return
 
-    def set_find_text(self, text: str):
-        """Set the find text"""
+                self.replace_all_begin.emit()
+                try:
+                    self.replace_all_requested.emit(
+                        find_text, replace_text, case_sensitive, whole_words
+                    )
+                finally:
+                    self.replace_all_end.emit()
+
+            box.finished.connect(on_finished)
+            box.open()
+
+    def set_find_text(self, text: str, select: bool = True):
+        """Set the find text, selecting it unless it is a large pasted block"""
         self.find_edit.setText(text)
-        self.find_edit.selectAll()
+        if select and len(text) < self._MAX_SELECT_LENGTH:
+            self.find_edit.selectAll()
 
 
 class TranslationSettingsDialog(QDialog):
@@ -269,17 +304,23 @@ class TranslationSettingsDialog(QDialog):
         type_group = QGroupBox("Translation Type")
         type_layout = QVBoxLayout(type_group)
 
-        self.visual_novel_radio = QCheckBox("Visual Novel Mode")
+        self.visual_novel_radio = QRadioButton("Visual Novel Mode")
         self.visual_novel_radio.setChecked(True)
         self.visual_novel_radio.setToolTip(
             "Use specialized prompts for visual novel translation"
         )
         type_layout.addWidget(self.visual_novel_radio)
 
-        self.general_radio = QCheckBox("General Translation")
+        self.general_radio = QRadioButton("General Translation")
         self.general_radio.setToolTip("Use general translation prompts")
         type_layout.addWidget(self.general_radio)
 
+        # Exclusive group so each click toggles exactly one pair of buttons
+        self.translation_type_group = QButtonGroup(self)
+        self.translation_type_group.setExclusive(True)
+        self.translation_type_group.addButton(self.visual_novel_radio)
+        self.translation_type_group.addButton(self.general_radio)
+
         layout.addWidget(type_group)
 
         # Auto-features
@@ -313,6 +354,9 @@ class TranslationSettingsDialog(QDialog):
 class HistoryViewDialog(QDialog):
     """Dialog for viewing translation history"""
 
+    # Shared content font, built on first use since QFont needs a QGuiApplication
+    _MONO_FONT = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Translation History")
@@ -322,6 +366,8 @@ class HistoryViewDialog(QDialog):
 
     def setup_ui(self):
         """Setup the history view UI"""
+        from PyQt6.QtWidgets import QListWidget, QSplitter, QTextEdit
+
         layout = QVBoxLayout(self)
 
         # Create splitter for history list and content
@@ -339,7 +385,11 @@ class HistoryViewDialog(QDialog):
 
         self.content_text = QTextEdit()
         self.content_text.setReadOnly(True)
-        self.content_text.setFont(QFont("Consolas", 10))
+        self.content_text.setUndoRedoEnabled(False)
+        self.content_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        if HistoryViewDialog._MONO_FONT is None:
+            HistoryViewDialog._MONO_FONT = QFont("Consolas", 10)
+        self.content_text.setFont(HistoryViewDialog._MONO_FONT)
         content_layout.addWidget(self.content_text)
 
         splitter.addWidget(content_widget)
@@ -371,35 +421,45 @@ class HistoryViewDialog(QDialog):
         self.history_list.clear()
         self.history_entries = history_entries
 
-        for i, entry in enumerate(history_entries):
-            item_text = f"{entry.role.title()} - {entry.timestamp}"
-            if entry.model_name:
-                item_text += f" ({entry.model_name})"
-
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, i)
-            self.history_list.addItem(item)
+        # Row i maps to history_entries[i], so plain strings are enough
+        get_fields = attrgetter("role", "timestamp", "model_name")
+        item_texts = [
+            f"{role.title()} - {timestamp}" + (f" ({model})" if model else "")
+            for role, timestamp, model in map(get_fields, history_entries)
+        ]
+        self.history_list.addItems(item_texts)
 
     def on_history_selected(self, current, previous):
         """Handle history item selection"""
         if current:
-            index = current.data(Qt.UserRole)
+            index = self.history_list.row(current)
             if 0 <= index < len(self.history_entries):
                 entry = self.history_entries[index]
                 content = "\n".join(entry.parts)
-                self.content_text.setPlainText(content)
+
+                # Lay the document out once instead of once per block
+                text_edit = self.content_text
+                text_edit.setUpdatesEnabled(False)
+                text_edit.document().blockSignals(True)
+                try:
+                    text_edit.setPlainText(content)
+                finally:
+                    text_edit.document().blockSignals(False)
+                    text_edit.setUpdatesEnabled(True)
 
     def clear_history(self):
         """Clear history with confirmation"""
-        reply = QMessageBox.question(
+        box = _create_question_box(
             self,
             "Clear History",
             "Are you sure you want to clear all translation history?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
         )
+        box.finished.connect(self._on_clear_history_finished)
+        box.open()
 
-        if reply == QMessageBox.Yes:
+    def _on_clear_history_finished(self, code: int):
+        """Clear history once the user confirmed the question box"""
+        if code == QMessageBox.StandardButton.Yes.value:
             self.history_list.clear()
             self.content_text.clear()
             # Signal to parent to clear actual history
@@ -416,6 +476,10 @@ class HistoryViewDialog(QDialog):
 class ContextFileSelectionDialog(QDialog):
     """Dialog để chọn files cho context"""
 
+    # Suggested column names offered by the column completers
+    _SOURCE_CHOICES = ("original text", "Original Text", "Text")
+    _TRANSLATION_CHOICES = ("Initial", "Machine translation", "Translation")
+
     def __init__(self, parent=None, available_files: list = None):
         super().__init__(parent)
         self.setWindowTitle("Select Context Files")
@@ -425,6 +489,8 @@ class ContextFileSelectionDialog(QDialog):
 
     def setup_ui(self):
         """Setup UI"""
+        from PyQt6.QtWidgets import QListWidget
+
         layout = QVBoxLayout(self)
 
         # Instructions
@@ -440,7 +506,6 @@ class ContextFileSelectionDialog(QDialog):
         files_layout = QVBoxLayout()
 
         self.file_list = QListWidget()
-        self.file_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
 
         # Load available files from parent's app state
         self.load_available_files()
@@ -468,13 +533,15 @@ class ContextFileSelectionDialog(QDialog):
         config_group = QGroupBox("Context Configuration")
         config_layout = QFormLayout()
 
-        self.source_column_combo = QComboBox()
-        self.source_column_combo.addItems(["original text", "Original Text", "Text"])
-        self.source_column_combo.setEditable(True)
+        self.source_column_edit = QLineEdit(self._SOURCE_CHOICES[0])
+        self.source_column_edit.setCompleter(
+            self._create_completer(self._SOURCE_CHOICES)
+        )
 
-        self.translation_column_combo = QComboBox()
-        self.translation_column_combo.addItems(["Initial", "Machine translation", "Translation"])
-        self.translation_column_combo.setEditable(True)
+        self.translation_column_edit = QLineEdit(self._TRANSLATION_CHOICES[0])
+        self.translation_column_edit.setCompleter(
+            self._create_completer(self._TRANSLATION_CHOICES)
+        )
 
         self.chunk_size_spin = QSpinBox()
         self.chunk_size_spin.setRange(10, 500)
@@ -487,8 +554,8 @@ class ContextFileSelectionDialog(QDialog):
         self.only_translated_check = QCheckBox("Only include rows with translations")
         self.only_translated_check.setChecked(True)
 
-        config_layout.addRow("Source Column:", self.source_column_combo)
-        config_layout.addRow("Translation Column:", self.translation_column_combo)
+        config_layout.addRow("Source Column:", self.source_column_edit)
+        config_layout.addRow("Translation Column:", self.translation_column_edit)
         config_layout.addRow("Chunk Size:", self.chunk_size_spin)
         config_layout.addRow("Max Context Chunks:", self.max_chunks_spin)
         config_layout.addRow("", self.only_translated_check)
@@ -512,8 +579,18 @@ class ContextFileSelectionDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _create_completer(self, choices):
+        """Create a case-insensitive completer over the given column names"""
+        from PyQt6.QtWidgets import QCompleter
+
+        completer = QCompleter(list(choices), self)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        return completer
+
     def load_available_files(self):
         """Load available files from parent window"""
+        from PyQt6.QtWidgets import QListWidgetItem
+
         self.file_list.clear()
 
         # Try to get files from parent's app state
@@ -525,6 +602,8 @@ class ContextFileSelectionDialog(QDialog):
                 file_name = Path(file_path).name if hasattr(file_path, '__fspath__') or isinstance(file_path, str) else str(file_path)
                 item = QListWidgetItem(file_name)
                 item.setData(Qt.ItemDataRole.UserRole, str(file_path))
+                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                item.setCheckState(Qt.CheckState.Unchecked)
                 self.file_list.addItem(item)
         elif self.available_files:
             # Use provided files
@@ -533,6 +612,8 @@ class ContextFileSelectionDialog(QDialog):
                 file_name = Path(file_path).name
                 item = QListWidgetItem(file_name)
                 item.setData(Qt.ItemDataRole.UserRole, str(file_path))
+                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                item.setCheckState(Qt.CheckState.Unchecked)
                 self.file_list.addItem(item)
         else:
             # No files available
@@ -541,27 +622,52 @@ class ContextFileSelectionDialog(QDialog):
             self.file_list.addItem(item)
 
     def select_all(self):
-        """Select all files"""
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            if item.flags() & Qt.ItemFlag.ItemIsSelectable:
-                item.setSelected(True)
+        """Check all files"""
+        self._set_all_check_states(Qt.CheckState.Checked)
 
     def deselect_all(self):
-        """Deselect all files"""
-        self.file_list.clearSelection()
+        """Uncheck all files"""
+        self._set_all_check_states(Qt.CheckState.Unchecked)
+
+    def _set_all_check_states(self, state: Qt.CheckState):
+        """Set the check state of every checkable item with a single repaint"""
+        count = self.file_list.count()
+        if count == 0:
+            return
+
+        # Block per-item itemChanged/dataChanged and emit one ranged update
+        self.file_list.blockSignals(True)
+        model = self.file_list.model()
+        model.blockSignals(True)
+        try:
+            for i in range(count):
+                item = self.file_list.item(i)
+                if item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+                    item.setCheckState(state)
+        finally:
+            model.blockSignals(False)
+            self.file_list.blockSignals(False)
+
+        model.dataChanged.emit(
+            model.index(0, 0),
+            model.index(count - 1, 0),
+            [Qt.ItemDataRole.CheckStateRole],
+        )
 
     def get_selection(self):
         """Get selected files and configuration"""
         selected_files = []
-        for item in self.file_list.selectedItems():
+        for i in range(self.file_list.count()):
+            item = self.file_list.item(i)
+            if item.checkState() != Qt.CheckState.Checked:
+                continue
             file_path = item.data(Qt.ItemDataRole.UserRole)
             if file_path:
                 selected_files.append(file_path)
 
         config = {
-            'source_column': self.source_column_combo.currentText(),
-            'translation_column': self.translation_column_combo.currentText(),
+            'source_column': self.source_column_edit.text(),
+            'translation_column': self.translation_column_edit.text(),
             'chunk_size': self.chunk_size_spin.value(),
             'max_context_chunks': self.max_chunks_spin.value(),
             'only_translated_rows': self.only_translated_check.isChecked()
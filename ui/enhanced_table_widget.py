@@ -15,13 +15,161 @@ from PyQt6.QtWidgets import (
     QLabel,
     QProgressBar,
     QToolTip,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QModelIndex
-from PyQt6.QtGui import QKeySequence, QShortcut, QPainter, QFont
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QObject, QEvent
+from PyQt6.QtGui import QKeySequence, QShortcut, QPainter, QFont, QBrush, QPalette
 from typing import List, Tuple, Optional, Set
+from collections import deque
+import os
 import time
 
 
+class CallThrottler(QObject):
+    """
+    Rate-limit calls to a function to one per timeout window.
+
+    The first call of a burst runs immediately (leading edge) and the most
+    recent call made during the window always runs when it ends (trailing
+    edge), so the final state is never dropped.
+    """
+
+    def __init__(self, func, timeout_ms: int, leading: bool = True, parent=None):
+        super().__init__(parent)
+        self._func = func
+        self._leading = leading
+        self._pending_args = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout_ms)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def __call__(self, *args):
+        if self._timer.isActive():
+            self._pending_args = args
+            return
+
+        if self._leading:
+            self._func(*args)
+        else:
+            self._pending_args = args
+        self._timer.start()
+
+    def _on_timeout(self):
+        """Run the trailing call, if any, and open a new window"""
+        if self._pending_args is None:
+            return
+
+        args, self._pending_args = self._pending_args, None
+        self._func(*args)
+        self._timer.start()
+
+
+class RingStats:
+    """Fixed-window samples with an incrementally maintained sum"""
+
+    def __init__(self, maxlen: int):
+        self._samples = deque(maxlen=maxlen)
+        self._sum = 0.0
+        self.appended = 0  # total samples ever added, to detect new data
+
+    def append(self, value: float):
+        """Add a sample, evicting the oldest one when the window is full"""
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            self._sum -= samples[0]
+        samples.append(value)
+        self._sum += value
+        self.appended += 1
+
+    def clear(self):
+        """Drop all samples"""
+        self._samples.clear()
+        self._sum = 0.0
+
+    def avg(self) -> float:
+        """Mean of the current window, 0 when empty"""
+        return self._sum / len(self._samples) if self._samples else 0.0
+
+    def max(self) -> float:
+        """Largest sample in the current window, 0 when empty"""
+        return max(self._samples) if self._samples else 0.0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __iter__(self):
+        return iter(self._samples)
+
+
+class SelectionCache:
+    """
+    Selected cells stored as (top, left, bottom, right) rectangles.
+
+    len() and membership tests work on the rectangles directly; cells are
+    only generated when the cache is iterated.
+    """
+
+    __slots__ = ("ranges", "_count")
+
+    def __init__(self, ranges: Optional[List[Tuple[int, int, int, int]]] = None):
+        self.ranges = ranges or []
+        self._count = sum(
+            (bottom - top + 1) * (right - left + 1)
+            for top, left, bottom, right in self.ranges
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        row, col = cell
+        return any(
+            top <= row <= bottom and left <= col <= right
+            for top, left, bottom, right in self.ranges
+        )
+
+    def __iter__(self):
+        for top, left, bottom, right in self.ranges:
+            for row in range(top, bottom + 1):
+                for col in range(left, right + 1):
+                    yield row, col
+
+
+class FastItemDelegate(QStyledItemDelegate):
+    """
+    Item delegate that only asks the model for the roles it serves.
+
+    The default delegate queries every style role (font, alignment, check
+    state, decoration, ...) per cell per paint; the pandas model only answers
+    display, background and foreground, so the other queries are skipped.
+    """
+
+    def initStyleOption(self, option, index):
+        model = index.model()
+        option.index = index
+        option.styleObject = None  # no style animations inside item views
+
+        text = model.data(index, Qt.ItemDataRole.DisplayRole)
+        if text:
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+            option.text = text
+
+        background = model.data(index, Qt.ItemDataRole.BackgroundRole)
+        if background is not None:
+            option.backgroundBrush = QBrush(background)
+
+        foreground = model.data(index, Qt.ItemDataRole.ForegroundRole)
+        if foreground is not None:
+            option.palette.setBrush(QPalette.ColorRole.Text, QBrush(foreground))
+
+        option.displayAlignment = (
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        )
+
+
 class VirtualizedTableView(QTableView):
     """
     Enhanced table view with:
@@ -40,12 +188,36 @@ class VirtualizedTableView(QTableView):
         super().__init__(parent)
 
         # Performance tracking
-        self.render_times = []
         self.max_render_samples = 100
+        self.render_times = RingStats(self.max_render_samples)
+        # Paint timing is opt-in and samples one paint in 32 when enabled
+        self._profile_paint = bool(os.environ.get("TABLE_PROFILE_PAINT"))
+        self._paint_counter = 0
+        self._last_metrics_sample = 0
+
+        # Selection tracking (100 ms budget, final selection always applied)
+        self.selection_cache = SelectionCache()
+        self._selection_throttler = CallThrottler(
+            self._do_selection_update, 100, leading=True, parent=self
+        )
+
+        # Cached C++ object pointers, refreshed in setModel
+        self._model = None
+        self._sel_model = None
+        self._has_model = False  # model set and non-empty, for shortcut paths
+        self._hheader = self.horizontalHeader()
+        self._vheader = self.verticalHeader()
 
-        # Selection tracking
-        self.last_selection_time = 0
-        self.selection_cache = set()
+        # Visible row/column counts, cleared on resize and model shape changes
+        self._visible_row_cache = None
+        self._visible_col_cache = None
+
+        # Zoom requests are coalesced and applied once the key repeat settles
+        self._pending_point_size = None
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(50)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
 
         # Setup enhanced features
         self._setup_enhanced_features()
@@ -60,8 +232,8 @@ class VirtualizedTableView(QTableView):
 
         # Enable sorting and resizing
         self.setSortingEnabled(True)
-        self.horizontalHeader().setStretchLastSection(False)
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self._hheader.setStretchLastSection(False)
+        self._hheader.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
 
         # Enable drag and drop
         self.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
@@ -72,16 +244,53 @@ class VirtualizedTableView(QTableView):
         self.setShowGrid(True)
         self.setGridStyle(Qt.PenStyle.SolidLine)
 
+        # Keep visible-count caches in sync with section sizes
+        self._hheader.sectionResized.connect(self._invalidate_visible_counts)
+        self._vheader.sectionResized.connect(self._invalidate_visible_counts)
+
         # Connect selection changes
         selection_model = self.selectionModel()
         if selection_model:
+            self._sel_model = selection_model
             selection_model.selectionChanged.connect(self._on_selection_changed)
 
     def _setup_performance_monitoring(self):
         """Setup performance monitoring"""
-        self.performance_timer = QTimer()
-        self.performance_timer.timeout.connect(self._update_performance_metrics)
-        self.performance_timer.start(5000)  # Update every 5 seconds
+        # Metrics are pushed when new paint samples arrive, throttled to one
+        # emission per 5 seconds (leading and trailing edge) instead of polling
+        self.performance_timer = QTimer(self)
+        self.performance_timer.setSingleShot(True)
+        self.performance_timer.setInterval(5000)
+        self.performance_timer.timeout.connect(self._on_metrics_throttle_timeout)
+        self._metrics_pending = False
+
+    def _emit_metrics_throttled(self):
+        """Emit metrics now, or once the current throttle window ends"""
+        if self.performance_timer.isActive():
+            self._metrics_pending = True
+            return
+
+        self._update_performance_metrics()
+        self.performance_timer.start()
+
+    def _on_metrics_throttle_timeout(self):
+        """Flush metrics that arrived during the throttle window"""
+        if self._metrics_pending:
+            self._metrics_pending = False
+            self._update_performance_metrics()
+            self.performance_timer.start()
+
+    def hideEvent(self, event):
+        """Stop metrics wakeups while the table is not visible"""
+        self.performance_timer.stop()
+        self._metrics_pending = False
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        """Stop the metrics timer when the table is closed"""
+        self.performance_timer.stop()
+        self._metrics_pending = False
+        super().closeEvent(event)
 
     def _setup_keyboard_shortcuts(self):
         """Setup enhanced keyboard shortcuts"""
@@ -102,61 +311,163 @@ class VirtualizedTableView(QTableView):
 
     def paintEvent(self, event):
         """Override paint event to track rendering performance"""
-        start_time = time.time()
+        if not self._profile_paint:
+            return super().paintEvent(event)
+
+        self._paint_counter += 1
+        if self._paint_counter & 0x1F:
+            return super().paintEvent(event)
+
+        start_time = time.perf_counter()
         super().paintEvent(event)
-        render_time = time.time() - start_time
 
-        # Track render times
-        self.render_times.append(render_time)
-        if len(self.render_times) > self.max_render_samples:
-            self.render_times.pop(0)
+        # Track render times (the ring drops the oldest sample itself)
+        self.render_times.append(time.perf_counter() - start_time)
+        self._emit_metrics_throttled()
+
+    def setPaintProfiling(self, enabled: bool):
+        """Enable or disable sampled paint-time tracking"""
+        self._profile_paint = enabled
+        self._paint_counter = 0
+
+    def setModel(self, model):
+        """Set the model and track its selection model and shape changes"""
+        old_model = self._model
+        if old_model is not None:
+            for signal in self._model_shape_signals(old_model):
+                try:
+                    signal.disconnect(self._on_model_shape_changed)
+                except TypeError:
+                    pass
+
+        old_sel_model = self._sel_model
+        super().setModel(model)
+        self._model = model
+        self._sel_model = self.selectionModel()
+        self._on_model_shape_changed()
+
+        if model is not None:
+            for signal in self._model_shape_signals(model):
+                signal.connect(self._on_model_shape_changed)
+
+        # Setting the same model again keeps the selection model, which is
+        # already connected
+        if self._sel_model is not old_sel_model:
+            if old_sel_model is not None:
+                try:
+                    old_sel_model.selectionChanged.disconnect(
+                        self._on_selection_changed
+                    )
+                except (TypeError, RuntimeError):
+                    pass  # Already disconnected or deleted with its model
+            if self._sel_model:
+                self._sel_model.selectionChanged.connect(self._on_selection_changed)
+
+    @staticmethod
+    def _model_shape_signals(model):
+        """Model signals that change the row or column count"""
+        return (
+            model.rowsInserted,
+            model.rowsRemoved,
+            model.columnsInserted,
+            model.columnsRemoved,
+            model.modelReset,
+        )
 
-    def _on_selection_changed(self, selected, deselected):
-        """Handle selection changes with performance optimization"""
-        current_time = time.time()
+    def _on_model_shape_changed(self, *args):
+        """Refresh state that depends on the model's row/column count"""
+        model = self._model
+        self._has_model = model is not None and model.rowCount() > 0
+        self._invalidate_visible_counts()
 
-        # Throttle selection updates
-        if current_time - self.last_selection_time < 0.1:  # 100ms throttle
-            return
+    def _invalidate_visible_counts(self, *args):
+        """Drop cached visible row/column counts"""
+        self._visible_row_cache = None
+        self._visible_col_cache = None
+
+    def resizeEvent(self, event):
+        """Invalidate visible counts when the viewport size changes"""
+        self._invalidate_visible_counts()
+        super().resizeEvent(event)
 
-        self.last_selection_time = current_time
+    def changeEvent(self, event):
+        """Invalidate visible counts when zooming changes the font"""
+        if event.type() == QEvent.Type.FontChange:
+            self._invalidate_visible_counts()
+        super().changeEvent(event)
 
-        # Update selection cache
-        selected_indexes = self.selectionModel().selectedIndexes()
-        self.selection_cache = {(idx.row(), idx.column()) for idx in selected_indexes}
+    def _on_selection_changed(self, selected, deselected):
+        """Handle selection changes with performance optimization"""
+        self._selection_throttler()
+
+    def _do_selection_update(self):
+        """Refresh the selection cache and emit the selection summary"""
+        # Work on selection rectangles rather than one QModelIndex per cell
+        selection_model = self._sel_model
+        ranges = [
+            (r.top(), r.left(), r.bottom(), r.right())
+            for r in selection_model.selection()
+        ]
+        if not ranges:
+            ranges = [
+                (idx.row(), idx.column(), idx.row(), idx.column())
+                for idx in selection_model.selectedIndexes()
+            ]
+
+        self.selection_cache = SelectionCache(ranges)
 
         # Emit selection summary
-        summary = self._create_selection_summary(selected_indexes)
+        summary = self._create_selection_summary(ranges, len(self.selection_cache))
         self.selectionSummaryChanged.emit(summary)
 
-    def _create_selection_summary(self, selected_indexes: List[QModelIndex]) -> str:
+    def _create_selection_summary(
+        self, ranges: List[Tuple[int, int, int, int]], cell_count: int
+    ) -> str:
         """Create a summary of the current selection"""
-        if not selected_indexes:
+        if not ranges:
             return "No selection"
 
-        rows = {idx.row() for idx in selected_indexes}
-        cols = {idx.column() for idx in selected_indexes}
+        # One pass over the ranges collects the row/column sets and minimums
+        rows = set()
+        cols = set()
+        min_row, min_col = ranges[0][0], ranges[0][1]
+        for top, left, bottom, right in ranges:
+            rows.update(range(top, bottom + 1))
+            cols.update(range(left, right + 1))
+            if top < min_row:
+                min_row = top
+            if left < min_col:
+                min_col = left
 
         row_count = len(rows)
         col_count = len(cols)
-        cell_count = len(selected_indexes)
 
         if row_count == 1 and col_count == 1:
-            return f"Cell ({min(rows)+1}, {min(cols)+1})"
+            return "Cell (%d, %d)" % (min_row + 1, min_col + 1)
         elif row_count == 1:
-            return f"Row {min(rows)+1}, {cell_count} cells"
+            return "Row %d, %d cells" % (min_row + 1, cell_count)
         elif col_count == 1:
-            return f"Column {min(cols)+1}, {cell_count} cells"
+            return "Column %d, %d cells" % (min_col + 1, cell_count)
         else:
-            return f"{row_count} rows × {col_count} columns ({cell_count} cells)"
+            return "%d rows × %d columns (%d cells)" % (
+                row_count,
+                col_count,
+                cell_count,
+            )
 
     def _update_performance_metrics(self):
         """Update and emit performance metrics"""
         if not self.render_times:
             return
 
-        avg_render_time = sum(self.render_times) / len(self.render_times)
-        max_render_time = max(self.render_times)
+        # Nothing new was rendered, or nobody can see the table
+        samples_seen = self.render_times.appended
+        if samples_seen == self._last_metrics_sample or not self.viewport().isVisible():
+            return
+        self._last_metrics_sample = samples_seen
+
+        avg_render_time = self.render_times.avg()
+        max_render_time = self.render_times.max()
 
         metrics = {
             "avg_render_time": avg_render_time,
@@ -171,36 +482,49 @@ class VirtualizedTableView(QTableView):
 
     def _get_visible_row_count(self) -> int:
         """Get number of visible rows"""
-        if not self.model():
+        if self._visible_row_cache is not None:
+            return self._visible_row_cache
+
+        if not self._model:
             return 0
 
         viewport_height = self.viewport().height()
-        row_height = self.verticalHeader().defaultSectionSize()
-        return min(viewport_height // row_height + 2, self.model().rowCount())
+        row_height = self._vheader.defaultSectionSize()
+        self._visible_row_cache = min(
+            viewport_height // row_height + 2, self._model.rowCount()
+        )
+        return self._visible_row_cache
 
     def _get_visible_column_count(self) -> int:
         """Get number of visible columns"""
-        if not self.model():
+        if self._visible_col_cache is not None:
+            return self._visible_col_cache
+
+        if not self._model:
             return 0
 
         viewport_width = self.viewport().width()
-        col_width = self.horizontalHeader().defaultSectionSize()
-        return min(viewport_width // col_width + 2, self.model().columnCount())
+        col_width = self._hheader.defaultSectionSize()
+        self._visible_col_cache = min(
+            viewport_width // col_width + 2, self._model.columnCount()
+        )
+        return self._visible_col_cache
 
     # Navigation methods
     def _go_to_top(self):
         """Go to top-left cell"""
-        if self.model():
-            index = self.model().index(0, 0)
+        if self._has_model:
+            index = self._model.index(0, 0)
             self.setCurrentIndex(index)
             self.scrollTo(index)
 
     def _go_to_bottom(self):
         """Go to bottom-right cell"""
-        if self.model():
-            last_row = self.model().rowCount() - 1
-            last_col = self.model().columnCount() - 1
-            index = self.model().index(last_row, last_col)
+        if self._has_model:
+            model = self._model
+            last_row = model.rowCount() - 1
+            last_col = model.columnCount() - 1
+            index = model.index(last_row, last_col)
             self.setCurrentIndex(index)
             self.scrollTo(index)
 
@@ -212,21 +536,23 @@ class VirtualizedTableView(QTableView):
     # Selection methods
     def _select_all_visible(self):
         """Select all visible cells"""
-        if not self.model():
+        if not self._has_model:
             return
 
+        model = self._model
         visible_rows = self._get_visible_row_count()
         visible_cols = self._get_visible_column_count()
 
-        top_left = self.model().index(0, 0)
-        bottom_right = self.model().index(visible_rows - 1, visible_cols - 1)
+        top_left = model.index(0, 0)
+        bottom_right = model.index(visible_rows - 1, visible_cols - 1)
 
         from PyQt6.QtCore import QItemSelection
 
         selection = QItemSelection(top_left, bottom_right)
-        self.selectionModel().select(
-            selection, self.selectionModel().SelectionFlag.Select
-        )
+        selection_model = self._sel_model
+
+        # One range select; the selection throttler coalesces the summary
+        selection_model.select(selection, selection_model.SelectionFlag.ClearAndSelect)
 
     def _select_column(self):
         """Select current column"""
@@ -243,25 +569,39 @@ class VirtualizedTableView(QTableView):
     # View methods
     def _reset_zoom(self):
         """Reset zoom to 100%"""
-        font = self.font()
-        font.setPointSize(9)  # Default size
-        self.setFont(font)
+        self._schedule_zoom(9)  # Default size
 
     def _zoom_in(self):
         """Zoom in"""
-        font = self.font()
-        current_size = font.pointSize()
-        if current_size < 20:  # Max zoom
-            font.setPointSize(current_size + 1)
-            self.setFont(font)
+        self._schedule_zoom(self._target_point_size() + 1)
 
     def _zoom_out(self):
         """Zoom out"""
+        self._schedule_zoom(self._target_point_size() - 1)
+
+    def _target_point_size(self) -> int:
+        """Point size after any zoom that is still pending"""
+        if self._pending_point_size is not None:
+            return self._pending_point_size
+        return self.font().pointSize()
+
+    def _schedule_zoom(self, point_size: int):
+        """Record the requested size (clamped to 6..20) and apply it shortly"""
+        self._pending_point_size = max(6, min(20, point_size))
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+
+    def _apply_zoom(self):
+        """Apply the pending zoom with a single font change"""
+        point_size = self._pending_point_size
+        self._pending_point_size = None
+
         font = self.font()
-        current_size = font.pointSize()
-        if current_size > 6:  # Min zoom
-            font.setPointSize(current_size - 1)
-            self.setFont(font)
+        if point_size is None or font.pointSize() == point_size:
+            return
+
+        font.setPointSize(point_size)
+        self.setFont(font)
 
     def mouseDoubleClickEvent(self, event):
         """Handle double click events"""
@@ -274,15 +614,11 @@ class VirtualizedTableView(QTableView):
         """Get current performance information"""
         return {
             "render_samples": len(self.render_times),
-            "avg_render_time": (
-                sum(self.render_times) / len(self.render_times)
-                if self.render_times
-                else 0
-            ),
+            "avg_render_time": self.render_times.avg(),
             "selection_cache_size": len(self.selection_cache),
             "model_size": (
-                f"{self.model().rowCount()}x{self.model().columnCount()}"
-                if self.model()
+                f"{self._model.rowCount()}x{self._model.columnCount()}"
+                if self._model
                 else "None"
             ),
         }
@@ -291,23 +627,42 @@ class VirtualizedTableView(QTableView):
 class SmartProgressBar(QProgressBar):
     """Progress bar with smart ETA calculation and throughput display"""
 
+    # ETA format and scale, indexed by (eta >= 1 minute) + (eta >= 1 hour)
+    _ETA_FORMATS = (("%.0fs", 1.0), ("%.1fm", 1.0 / 60), ("%.1fh", 1.0 / 3600))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.start_time = None
         self.processed_items = 0
         self.total_items = 0
+        self._percent_per_item = 0.0
         self.last_update_time = 0
+        self._ema_rate = 0.0
+        self._last_items = 0
+        self._last_t = None
+        self._last_format = ""
 
     def start_progress(self, total_items: int):
         """Start progress tracking"""
         self.start_time = time.time()
         self.total_items = total_items
+        self._percent_per_item = 100.0 / total_items if total_items else 0.0
+        self._ema_rate = 0.0
+        self._last_items = 0
+        self._last_t = self.start_time
+        self.last_update_time = 0
         self.processed_items = 0
         self.setMaximum(total_items)
         self.setValue(0)
 
     def update_progress(self, completed_items: int):
         """Update progress with smart ETA calculation"""
+        # Keep the value current but skip ETA/format work while hidden
+        if not self.isVisible():
+            self.processed_items = completed_items
+            self.setValue(completed_items)
+            return
+
         current_time = time.time()
 
         # Throttle updates for performance
@@ -318,32 +673,44 @@ class SmartProgressBar(QProgressBar):
         self.processed_items = completed_items
         self.setValue(completed_items)
 
-        # Calculate ETA
+        # Calculate ETA from an exponential moving average of the throughput
         if self.start_time and completed_items > 0:
-            elapsed_time = current_time - self.start_time
-            items_per_second = completed_items / elapsed_time
+            dt = current_time - self._last_t
+            if dt >= 0.1:
+                instant_rate = (completed_items - self._last_items) / dt
+                self._ema_rate = (
+                    0.3 * instant_rate + 0.7 * self._ema_rate
+                    if self._ema_rate
+                    else instant_rate
+                )
+                self._last_items = completed_items
+                self._last_t = current_time
+            items_per_second = self._ema_rate
+            percentage = completed_items * self._percent_per_item
 
             if items_per_second > 0:
                 remaining_items = self.total_items - completed_items
                 eta_seconds = remaining_items / items_per_second
 
                 # Format ETA
-                if eta_seconds < 60:
-                    eta_text = f"{eta_seconds:.0f}s"
-                elif eta_seconds < 3600:
-                    eta_text = f"{eta_seconds/60:.1f}m"
-                else:
-                    eta_text = f"{eta_seconds/3600:.1f}h"
+                eta_format, eta_scale = self._ETA_FORMATS[
+                    (eta_seconds >= 60) + (eta_seconds >= 3600)
+                ]
+                eta_text = eta_format % (eta_seconds * eta_scale)
 
                 # Update format
-                percentage = (completed_items / self.total_items) * 100
-                throughput_text = f"{items_per_second:.1f} items/s"
-
-                self.setFormat(
-                    f"{percentage:.1f}% - ETA: {eta_text} ({throughput_text})"
+                self._set_format_if_changed(
+                    "%.1f%% - ETA: %s (%.1f items/s)"
+                    % (percentage, eta_text, items_per_second)
                 )
             else:
-                self.setFormat(f"{(completed_items / self.total_items) * 100:.1f}%")
+                self._set_format_if_changed("%.1f%%" % percentage)
+
+    def _set_format_if_changed(self, text: str):
+        """Set the bar text only when it differs from the last one"""
+        if text != self._last_format:
+            self._last_format = text
+            self.setFormat(text)
 
     def finish_progress(self):
         """Finish progress tracking"""
@@ -353,9 +720,11 @@ class SmartProgressBar(QProgressBar):
             total_time = time.time() - self.start_time
             if total_time > 0:
                 avg_throughput = self.total_items / total_time
-                self.setFormat(f"Completed - {avg_throughput:.1f} items/s average")
+                self._set_format_if_changed(
+                    "Completed - %.1f items/s average" % avg_throughput
+                )
             else:
-                self.setFormat("Completed")
+                self._set_format_if_changed("Completed")
 
 
 class TableStatusWidget(QWidget):
@@ -363,6 +732,9 @@ class TableStatusWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Last applied label colors; restyling only happens when they change
+        self._perf_color = None
+        self._mem_color = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -384,9 +756,15 @@ class TableStatusWidget(QWidget):
         self.memory_label = QLabel("Memory: --")
         layout.addWidget(self.memory_label)
 
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        """Set label text only when it differs, avoiding needless relayouts"""
+        if label.text() != text:
+            label.setText(text)
+
     def update_selection(self, selection_text: str):
         """Update selection information"""
-        self.selection_label.setText(f"Selection: {selection_text}")
+        self._set_label_text(self.selection_label, "Selection: %s" % selection_text)
 
     def update_performance(self, metrics: dict):
         """Update performance metrics"""
@@ -401,8 +779,12 @@ class TableStatusWidget(QWidget):
             status = "Poor"
             color = "red"
 
-        self.performance_label.setText(f"Performance: {status} ({fps:.1f} FPS)")
-        self.performance_label.setStyleSheet(f"color: {color}")
+        self._set_label_text(
+            self.performance_label, "Performance: %s (%.1f FPS)" % (status, fps)
+        )
+        if color != self._perf_color:
+            self._perf_color = color
+            self.performance_label.setStyleSheet("color: %s" % color)
 
     def update_memory(self, memory_mb: float):
         """Update memory usage display"""
@@ -413,6 +795,8 @@ class TableStatusWidget(QWidget):
         else:
             color = "red"
 
-        self.memory_label.setText(f"Memory: {memory_mb:.1f} MB")
-        self.memory_label.setStyleSheet(f"color: {color}")
+        self._set_label_text(self.memory_label, "Memory: %.1f MB" % memory_mb)
+        if color != self._mem_color:
+            self._mem_color = color
+            self.memory_label.setStyleSheet("color: %s" % color)
 
@@ -3,12 +3,18 @@ Main window for the CSV Translator application
 """
 
 import sys
+import base64
+from collections import deque
+import io
 import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 import os
 
+import numpy as np
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -29,8 +35,18 @@ from PyQt6.QtWidgets import (
     QFrame,
     QTabWidget,
 )
-from PyQt6.QtGui import QAction, QKeySequence, QIcon
-from PyQt6.QtCore import Qt, QModelIndex, pyqtSignal, QTimer
+from PyQt6.QtGui import QAction, QKeySequence, QIcon, QShortcut, QTextCursor
+from PyQt6.QtCore import (
+    Qt,
+    QModelIndex,
+    QPersistentModelIndex,
+    pyqtSignal,
+    QTimer,
+    QThreadPool,
+    QRunnable,
+    QObject,
+    QSignalBlocker,
+)
 
 from config.settings import AppSettings
 from core.preferences import prefs
@@ -50,13 +66,114 @@ from core.translation_engine import TranslationEngine
 from core.history_manager import HistoryManager
 from ui.components.config_panel import ConfigPanel
 from ui.components.action_panel import ExtendedActionPanel
-from ui.dialogs import APIKeyDialog, FindReplaceDialog
-from utils.file_utils import ConfigManager
+from ui.enhanced_table_widget import FastItemDelegate
+from utils.file_utils import ConfigManager, FileUtils
+
+
+# Provider identifiers the translation engine accepts keys for
+_PROVIDER_VALUES = frozenset(p.value for p in ModelProvider)
+
+# Model name keyword -> provider, checked in order; anything else is Google
+_PROVIDER_KEYWORDS = (
+    ("gpt", ModelProvider.OPENAI),
+    ("openai", ModelProvider.OPENAI),
+    ("claude", ModelProvider.ANTHROPIC),
+    ("anthropic", ModelProvider.ANTHROPIC),
+)
+
+class _RecoveryScanSignals(QObject):
+    """Signals for _RecoveryScanner"""
+
+    finished = pyqtSignal(object)  # recovery data dict or None
+
+
+class _RecoveryScanner(QRunnable):
+    """Reads the autosave recovery file off the UI thread"""
+
+    def __init__(self, autosave_manager: AutoSaveManager):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.autosave_manager = autosave_manager
+        self.signals = _RecoveryScanSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.autosave_manager.check_for_recovery())
+
+
+class _SaveSignals(QObject):
+    """Signals for _SaveRunnable"""
+
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class _SaveRunnable(QRunnable):
+    """Runs a file save off the UI thread"""
+
+    def __init__(self, save_func, *args):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.save_func = save_func
+        self.args = args
+        self.signals = _SaveSignals()
+
+    def run(self):
+        try:
+            success = bool(self.save_func(*self.args))
+        except OSError as e:
+            # The failed write itself says why (permissions, file in use, ...)
+            self.signals.finished.emit(False, e.strerror or str(e))
+            return
+        except Exception as e:
+            print(f"Save error traceback:\n{traceback.format_exc()}")
+            self.signals.finished.emit(False, str(e))
+            return
+        self.signals.finished.emit(success, "")
+
+
+# Larger selections are autosaved as ("all", cell_count) instead of cell lists
+_MAX_AUTOSAVE_SELECTION = 1000
+
+# Placeholder entry in the menu table for the recent projects submenu
+_RECENT_PROJECTS_MENU = object()
+
+# Seconds a recent project existence check is reused for
+_RECENT_EXISTS_TTL = 5.0
+
+# Lines kept in the status log; older pending lines are dropped first
+_LOG_MAX_LINES = 1000
+
+# Window-wide shortcuts, parsed once at import: (key sequence, slot name)
+_SHORTCUT_SPECS = [
+    (QKeySequence("Ctrl+S"), "save_changes"),
+    (QKeySequence("Ctrl+Z"), "undo"),
+    (QKeySequence("Ctrl+Y"), "redo"),
+    (QKeySequence("Ctrl+C"), "copy_selected"),
+    (QKeySequence("Ctrl+X"), "cut_selected"),
+    (QKeySequence("Ctrl+V"), "paste_data"),
+    (QKeySequence("Del"), "delete_selected"),
+    (QKeySequence("Ctrl+F"), "show_find_dialog"),
+    (QKeySequence("F3"), "find_next"),
+    (QKeySequence("Shift+F3"), "find_previous"),
+]
 
 
 class CSVTranslatorMainWindow(QMainWindow):
     """Main window for the CSV Translator application"""
 
+    # Emitted whenever the undo/redo status may have changed
+    status_dirty = pyqtSignal()
+    # Emitted by log() (possibly from worker threads) to schedule a flush
+    _log_flush_requested = pyqtSignal()
+    # Emitted from the auto-translate threads: (done, total, message) and
+    # (successful, failed, current file was translated)
+    _auto_translate_progress = pyqtSignal(int, int, str)
+    _auto_translate_finished = pyqtSignal(int, int, bool)
+    # Emitted by translation_worker with a chunk's results: col, rows, values
+    translationApplied = pyqtSignal(int, list, list)
+
+    # Generated stylesheets, keyed by theme name
+    _theme_styles = {}
+
     def __init__(self):
         super().__init__()
 
@@ -77,11 +194,57 @@ class CSVTranslatorMainWindow(QMainWindow):
         self.find_dialog = None
         self.settings_visible = True
 
+        # Log lines are buffered and appended to the status log in batches;
+        # worker threads only touch the deque and a queued signal
+        self._log_buffer = deque(maxlen=_LOG_MAX_LINES)
+        # (second, formatted timestamp) shared by all log calls in that second
+        self._log_stamp = (0, "")
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_requested.connect(
+            self._schedule_log_flush, Qt.ConnectionType.QueuedConnection
+        )
+
+        # Path and name of the file in the table, set whenever a file is loaded
+        self._current_file_str = ""
+        self._current_file_name = ""
+
+        # Per-provider autosave dirty flags; clean providers reuse their last
+        # result instead of re-serializing
+        self._autosave_dirty = {
+            "table_data": True,
+            "ui_state": True,
+            "project_state": True,
+        }
+        self._autosave_cache = {}
+
+        # Preference writes from the settings handlers are coalesced and
+        # flushed 300 ms after the last change
+        self._pending_prefs = {}
+        self._pref_timer = QTimer(self)
+        self._pref_timer.setSingleShot(True)
+        self._pref_timer.setInterval(300)
+        self._pref_timer.timeout.connect(self._flush_prefs)
+
+        # Table context menus, built on first use and keyed by has_selection
+        self._context_menus = {}
+
+        # Recent project path -> (exists, time.monotonic() of the check)
+        self._recent_exists_cache = {}
+
+        # Input directory last scanned by the file manager (see load_files)
+        self._scanned_input_dir = None
+
+        # Saves run on the thread pool; only one may be in flight at a time
+        self._save_runnable = None
+        self._save_filename = ""
+
         # Setup
         self.setup_window()
         self.setup_ui()
         self.setup_shortcuts()
-        self.setup_api_keys()
 
         # Setup storage systems
         self.setup_storage_managers()
@@ -90,16 +253,63 @@ class CSVTranslatorMainWindow(QMainWindow):
         theme = prefs.get("theme", AppSettings.DEFAULT_THEME)
         self.apply_theme(theme)
 
-        # Status update timer
-        self.status_timer = QTimer()
+        # Status updates are event-driven; bursts of status_dirty collapse
+        # into a single update_status call 100 ms later
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(100)
         self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(1000)  # Update every second
+        self.status_dirty.connect(
+            self._schedule_status_update, Qt.ConnectionType.QueuedConnection
+        )
+
+        # Auto-translate reports back from its worker threads
+        self._auto_translate_progress.connect(
+            self.on_auto_translate_progress, Qt.ConnectionType.QueuedConnection
+        )
+        self._auto_translate_finished.connect(
+            self.on_auto_translate_finished, Qt.ConnectionType.QueuedConnection
+        )
 
-        # Check for recovery on startup
+        # Translated chunks are written to the model on the GUI thread
+        self.translationApplied.connect(
+            self.on_translation_applied, Qt.ConnectionType.QueuedConnection
+        )
+
+        # API keys, recovery check and last project load run once the window
+        # has been shown (see showEvent)
+        self._post_show_done = False
+
+    def showEvent(self, event):
+        """Run deferred startup work after the window is first painted"""
+        super().showEvent(event)
+        if not self._post_show_done:
+            self._post_show_done = True
+            # Warm heavy imports off the UI thread while the recovery prompt
+            # and project load run
+            QThreadPool.globalInstance().start(self._prewarm_imports)
+            QTimer.singleShot(0, self._run_post_show_tasks)
+
+    @staticmethod
+    def _prewarm_imports():
+        """Import modules used only by autosave/recovery ahead of time"""
+        try:
+            import pyarrow.feather  # noqa: F401
+        except ImportError:
+            pass
+
+    def _run_post_show_tasks(self):
+        """Slow startup steps, kept in their original order"""
+        self.setup_api_keys()
+
+        # Check for recovery on startup; the last project is loaded once the
+        # background scan has been answered
         self.check_recovery_on_startup()
 
-        # Load last project if available
-        self.load_last_project()
+    def _schedule_status_update(self):
+        """Coalesce status refresh requests"""
+        if not self.status_timer.isActive():
+            self.status_timer.start()
 
     def setup_window(self):
         """Setup main window properties"""
@@ -132,13 +342,67 @@ class CSVTranslatorMainWindow(QMainWindow):
         self.setup_main_tab()
         self.tab_widget.addTab(self.main_tab, "📄 Main Workspace")
 
-        # Tab 2: API Configuration (lazy import to avoid QWidget before QApplication)
+        # Secondary tabs are built on first visit; until then they hold an
+        # empty placeholder (lazy import also avoids QWidget before QApplication)
+        self._add_lazy_tab(
+            "api_config_panel", "🔑 API Configuration", self._create_api_config_panel
+        )
+        self._add_lazy_tab(
+            "instruction_panel", "📝 Instructions", self._create_instruction_panel
+        )
+        self._add_lazy_tab("summary_panel", "📊 Summary", self._create_summary_panel)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+
+        # Setup menu bar after all components are created
+        self.setup_menu_bar()
+
+    def _add_lazy_tab(self, attr_name: str, label: str, factory):
+        """Add a placeholder tab whose real panel is created on first show"""
+        placeholder = QWidget()
+        placeholder._lazy_factory = (attr_name, factory)
+        setattr(self, attr_name, None)
+        self.tab_widget.addTab(placeholder, label)
+
+    def _materialize_tab(self, index: int):
+        """Replace a lazy placeholder tab with its real panel"""
+        placeholder = self.tab_widget.widget(index)
+        lazy = getattr(placeholder, "_lazy_factory", None)
+        if lazy is None:
+            return
+
+        attr_name, factory = lazy
+        placeholder._lazy_factory = None
+        current_index = self.tab_widget.currentIndex()
+        label = self.tab_widget.tabText(index)
+
+        panel = factory()
+
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, panel, label)
+            self.tab_widget.setCurrentIndex(current_index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _ensure_lazy_panel(self, attr_name: str):
+        """Build a lazy tab panel now if it has not been shown yet"""
+        for index in range(self.tab_widget.count()):
+            lazy = getattr(self.tab_widget.widget(index), "_lazy_factory", None)
+            if lazy is not None and lazy[0] == attr_name:
+                self._materialize_tab(index)
+                break
+        return getattr(self, attr_name)
+
+    def _create_api_config_panel(self) -> QWidget:
+        """Create the API configuration tab"""
         try:
             from ui.components.api_config_panel import APIConfigPanel
 
             self.api_config_panel = APIConfigPanel()
             self.api_config_panel.api_key_changed.connect(self.on_api_key_configured)
-            self.tab_widget.addTab(self.api_config_panel, "🔑 API Configuration")
+            return self.api_config_panel
         except Exception as e:
             # Create placeholder with error message
             placeholder = QWidget()
@@ -154,11 +418,12 @@ class CSVTranslatorMainWindow(QMainWindow):
             error_label.setWordWrap(True)
             placeholder_layout.addWidget(error_label)
             placeholder_layout.addStretch()
-            self.tab_widget.addTab(placeholder, "🔑 API Configuration")
             self.api_config_panel = None
             print(f"Warning: Could not load API Configuration panel: {e}")
+            return placeholder
 
-        # Tab 3: System Instructions
+    def _create_instruction_panel(self) -> QWidget:
+        """Create the system instructions tab"""
         try:
             from ui.components.instruction_panel import InstructionPanel
 
@@ -166,28 +431,24 @@ class CSVTranslatorMainWindow(QMainWindow):
             self.instruction_panel.instruction_changed.connect(
                 self.on_instruction_changed
             )
-            self.tab_widget.addTab(self.instruction_panel, "📝 Instructions")
+            return self.instruction_panel
         except Exception as e:
-            placeholder = QWidget()
-            self.tab_widget.addTab(placeholder, "📝 Instructions")
             self.instruction_panel = None
             print(f"Warning: Could not load Instructions panel: {e}")
+            return QWidget()
 
-        # Tab 4: Summary
+    def _create_summary_panel(self) -> QWidget:
+        """Create the summary tab"""
         try:
             from ui.components.summary_panel import SummaryPanel
 
             self.summary_panel = SummaryPanel()
             self.summary_panel.summary_requested.connect(self.on_summary_requested)
-            self.tab_widget.addTab(self.summary_panel, "📊 Summary")
+            return self.summary_panel
         except Exception as e:
-            placeholder = QWidget()
-            self.tab_widget.addTab(placeholder, "📊 Summary")
             self.summary_panel = None
             print(f"Warning: Could not load Summary panel: {e}")
-
-        # Setup menu bar after all components are created
-        self.setup_menu_bar()
+            return QWidget()
 
     def setup_main_tab(self):
         """Setup main workspace tab"""
@@ -227,6 +488,7 @@ class CSVTranslatorMainWindow(QMainWindow):
         self.config_panel.load_files_requested.connect(self.load_files)
         self.config_panel.custom_model_added.connect(self.on_custom_model_added)
         self.config_panel.custom_model_removed.connect(self.on_custom_model_removed)
+        self.config_panel.state_applied.connect(self.on_config_state_applied)
         settings_layout.addWidget(self.config_panel)
 
         main_layout.addWidget(self.settings_container)
@@ -277,6 +539,14 @@ class CSVTranslatorMainWindow(QMainWindow):
         self.cell_detail_text.textChanged.connect(self.on_cell_detail_modified)
         cell_detail_layout.addWidget(self.cell_detail_text)
 
+        # Keystrokes in the detail editor are written back in one setData per
+        # 150 ms burst
+        self._cell_detail_index = QPersistentModelIndex()
+        self._cell_detail_timer = QTimer(self)
+        self._cell_detail_timer.setSingleShot(True)
+        self._cell_detail_timer.setInterval(150)
+        self._cell_detail_timer.timeout.connect(self._commit_cell_detail)
+
         bottom_layout.addWidget(cell_detail_group)
 
         # Status log
@@ -285,6 +555,7 @@ class CSVTranslatorMainWindow(QMainWindow):
 
         self.status_text = QTextEdit()
         self.status_text.setReadOnly(True)
+        self.status_text.document().setMaximumBlockCount(_LOG_MAX_LINES)
         self.status_text.setMaximumHeight(AppSettings.STATUS_HEIGHT)
         status_layout.addWidget(self.status_text)
 
@@ -299,102 +570,98 @@ class CSVTranslatorMainWindow(QMainWindow):
         """Setup the menu bar"""
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("File")
-
-        open_action = QAction("Open Directory...", self)
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self.config_panel.browse_input_dir)
-        file_menu.addAction(open_action)
-
-        save_action = QAction("Save Changes", self)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.triggered.connect(self.save_changes)
-        file_menu.addAction(save_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Project menu
-        project_menu = menubar.addMenu("Project")
-
-        new_project_action = QAction("New Project...", self)
-        new_project_action.setShortcut(QKeySequence("Ctrl+Shift+N"))
-        new_project_action.triggered.connect(self.new_project)
-        project_menu.addAction(new_project_action)
-
-        open_project_action = QAction("Open Project...", self)
-        open_project_action.setShortcut(QKeySequence("Ctrl+Shift+O"))
-        open_project_action.triggered.connect(self.open_project)
-        project_menu.addAction(open_project_action)
-
-        save_project_action = QAction("Save Project", self)
-        save_project_action.setShortcut(QKeySequence("Ctrl+Shift+S"))
-        save_project_action.triggered.connect(self.save_project)
-        project_menu.addAction(save_project_action)
-
-        save_project_as_action = QAction("Save Project As...", self)
-        save_project_as_action.triggered.connect(self.save_project_as)
-        project_menu.addAction(save_project_as_action)
-
-        project_menu.addSeparator()
-
-        # Recent projects submenu
-        self.recent_projects_menu = project_menu.addMenu("Recent Projects")
-        self.update_recent_projects_menu()
-
-        # Edit menu
-        edit_menu = menubar.addMenu("Edit")
-
-        undo_action = QAction("Undo", self)
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.triggered.connect(self.undo)
-        edit_menu.addAction(undo_action)
-
-        redo_action = QAction("Redo", self)
-        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.triggered.connect(self.redo)
-        edit_menu.addAction(redo_action)
-
-        edit_menu.addSeparator()
-
-        find_action = QAction("Find and Replace...", self)
-        find_action.setShortcut(QKeySequence.StandardKey.Find)
-        find_action.triggered.connect(self.show_find_dialog)
-        edit_menu.addAction(find_action)
-
-        # Translation menu
-        translation_menu = menubar.addMenu("Translation")
-
-        translate_action = QAction("Translate Current File", self)
-        translate_action.setShortcut(QKeySequence("Ctrl+T"))
-        translate_action.triggered.connect(self.translate_current_file)
-        translation_menu.addAction(translate_action)
-
-        auto_translate_action = QAction("Auto Translate All", self)
-        auto_translate_action.triggered.connect(self.auto_translate_all)
-        translation_menu.addAction(auto_translate_action)
-
-        translation_menu.addSeparator()
-
-        summarize_action = QAction("Summarize History", self)
-        summarize_action.triggered.connect(self.summarize_history)
-        translation_menu.addAction(summarize_action)
-
-        # Tools menu
-        tools_menu = menubar.addMenu("Tools")
+        # Menu title -> entries of (text, slot, shortcut); None is a separator
+        # and _RECENT_PROJECTS_MENU marks where the recent projects submenu goes
+        menus = [
+            (
+                "File",
+                [
+                    (
+                        "Open Directory...",
+                        self.config_panel.browse_input_dir,
+                        QKeySequence.StandardKey.Open,
+                    ),
+                    ("Save Changes", self.save_changes, QKeySequence.StandardKey.Save),
+                    None,
+                    ("Exit", self.close, QKeySequence.StandardKey.Quit),
+                ],
+            ),
+            (
+                "Project",
+                [
+                    ("New Project...", self.new_project, QKeySequence("Ctrl+Shift+N")),
+                    (
+                        "Open Project...",
+                        self.open_project,
+                        QKeySequence("Ctrl+Shift+O"),
+                    ),
+                    ("Save Project", self.save_project, QKeySequence("Ctrl+Shift+S")),
+                    ("Save Project As...", self.save_project_as, None),
+                    None,
+                    _RECENT_PROJECTS_MENU,
+                ],
+            ),
+            (
+                "Edit",
+                [
+                    ("Undo", self.undo, QKeySequence.StandardKey.Undo),
+                    ("Redo", self.redo, QKeySequence.StandardKey.Redo),
+                    None,
+                    (
+                        "Find and Replace...",
+                        self.show_find_dialog,
+                        QKeySequence.StandardKey.Find,
+                    ),
+                ],
+            ),
+            (
+                "Translation",
+                [
+                    (
+                        "Translate Current File",
+                        self.translate_current_file,
+                        QKeySequence("Ctrl+T"),
+                    ),
+                    ("Auto Translate All", self.auto_translate_all, None),
+                    None,
+                    ("Summarize History", self.summarize_history, None),
+                ],
+            ),
+            (
+                "Tools",
+                [
+                    ("API Keys...", self.setup_api_keys, None),
+                    ("Toggle Theme", self.toggle_theme, None),
+                ],
+            ),
+        ]
 
-        api_keys_action = QAction("API Keys...", self)
-        api_keys_action.triggered.connect(self.setup_api_keys)
-        tools_menu.addAction(api_keys_action)
+        for title, entries in menus:
+            menu = menubar.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                elif entry is _RECENT_PROJECTS_MENU:
+                    # Recent projects submenu
+                    self.recent_projects_menu = menu.addMenu("Recent Projects")
+                    self.recent_projects_menu.aboutToShow.connect(
+                        self._lazy_populate_recent
+                    )
+                    self.recent_projects_menu.triggered.connect(
+                        self._on_recent_project_triggered
+                    )
+                    self.update_recent_projects_menu()
+                else:
+                    self._add_menu_action(menu, *entry)
 
-        theme_action = QAction("Toggle Theme", self)
-        theme_action.triggered.connect(self.toggle_theme)
-        tools_menu.addAction(theme_action)
+    def _add_menu_action(self, menu, text: str, slot, shortcut=None) -> QAction:
+        """Create an action, connect it and add it to a menu"""
+        action = QAction(text, self)
+        if shortcut is not None:
+            action.setShortcut(shortcut)
+        action.triggered.connect(slot)
+        menu.addAction(action)
+        return action
 
     def setup_table_view(self):
         """Setup the table view"""
@@ -408,6 +675,20 @@ class CSVTranslatorMainWindow(QMainWindow):
         )
         self.table_view.setMinimumHeight(AppSettings.TABLE_MIN_HEIGHT)
 
+        # Fixed-height rows and a delegate that skips unused style roles keep
+        # per-scroll model queries down
+        vertical_header = self.table_view.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(AppSettings.TABLE_ROW_HEIGHT)
+        self.table_view.setVerticalScrollMode(
+            QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
+        self.table_view.setHorizontalScrollMode(
+            QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
+        self.table_view.setTextElideMode(Qt.TextElideMode.ElideRight)
+        self.table_view.setItemDelegate(FastItemDelegate(self.table_view))
+
         # Setup model
         self.table_model = EnhancedPandasModel()
         self.table_view.setModel(self.table_model)
@@ -418,54 +699,70 @@ class CSVTranslatorMainWindow(QMainWindow):
             self.on_selection_changed
         )
         self.table_model.dataEdited.connect(self.on_data_edited)
+        self.table_model.columnValuesEdited.connect(self.on_column_values_edited)
+        self.table_model.modelReset.connect(self.status_dirty)
+
+        # Column widths and selected cells for autosave are cached; widths are
+        # kept current from sectionResized and rebuilt after a model reset
+        self._col_widths = None
+        self._selected_cells = None
+        self.table_view.horizontalHeader().sectionResized.connect(self._on_col_resized)
+        self.table_model.modelReset.connect(self._invalidate_col_widths)
+        self.table_model.columnsInserted.connect(self._invalidate_col_widths)
+        self.table_model.columnsRemoved.connect(self._invalidate_col_widths)
+        self.table_model.modelReset.connect(
+            lambda: self._mark_autosave_dirty("table_data")
+        )
+        self.table_view.verticalScrollBar().valueChanged.connect(
+            self._mark_ui_state_dirty
+        )
 
         # Setup context menu
         self.table_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table_view.customContextMenuRequested.connect(self.show_context_menu)
 
+    def _on_col_resized(self, logical_index: int, old_size: int, new_size: int):
+        """Keep the cached column widths in sync with the header"""
+        if self._col_widths is not None:
+            self._col_widths[logical_index] = new_size
+        self._autosave_dirty["ui_state"] = True
+
+    def _invalidate_col_widths(self, *args):
+        """Rebuild column widths on next autosave"""
+        self._col_widths = None
+        self._autosave_dirty["ui_state"] = True
+
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
         # Standard shortcuts
-        shortcuts = [
-            ("Ctrl+S", self.save_changes),
-            ("Ctrl+Z", self.undo),
-            ("Ctrl+Y", self.redo),
-            ("Ctrl+C", self.copy_selected),
-            ("Ctrl+X", self.cut_selected),  # Add cut shortcut
-            ("Ctrl+V", self.paste_data),
-            ("Del", self.delete_selected),
-            ("Ctrl+F", self.show_find_dialog),
-            ("F3", self.find_next),
-            ("Shift+F3", self.find_previous),
-        ]
-
-        for shortcut, function in shortcuts:
-            action = QAction(self)
-            action.setShortcut(QKeySequence(shortcut))
-            action.triggered.connect(function)
-            self.addAction(action)
+        for key_sequence, slot_name in _SHORTCUT_SPECS:
+            QShortcut(
+                key_sequence,
+                self,
+                getattr(self, slot_name),
+                context=Qt.ShortcutContext.WindowShortcut,
+            )
 
     def setup_api_keys(self):
         """Setup API keys - now handled by API config panel"""
         # Load API keys from API service manager if available
-        if hasattr(self, "api_config_panel") and self.api_config_panel is not None:
+        if self._ensure_lazy_panel("api_config_panel") is not None:
             try:
                 api_manager = self.api_config_panel.get_api_manager()
 
-                # Get all services with API keys
-                for service in api_manager.get_all_services():
-                    if api_manager.has_api_key(service.id):
-                        api_key = api_manager.get_api_key(service.id)
+                # Decrypt all stored keys in one pass
+                for service_id, api_key in api_manager.get_all_api_keys().items():
+                    service = api_manager.get_service(service_id)
+                    if service is None:
+                        continue
 
-                        # Set in translation engine (map to provider)
-                        if service.provider_type.value in [
-                            p.value for p in ModelProvider
-                        ]:
-                            provider = ModelProvider(service.provider_type.value)
-                            self.translation_engine.set_api_key(provider, api_key)
+                    # Set in translation engine (map to provider)
+                    if service.provider_type.value in _PROVIDER_VALUES:
+                        provider = ModelProvider(service.provider_type.value)
+                        self.translation_engine.set_api_key(provider, api_key)
 
-                            # Store in app state
-                            self.app_state.api_keys[provider.value] = api_key
+                        # Store in app state
+                        self.app_state.api_keys[provider.value] = api_key
 
                 if self.app_state.api_keys:
                     self.log(f"Loaded {len(self.app_state.api_keys)} API key(s)")
@@ -488,34 +785,67 @@ class CSVTranslatorMainWindow(QMainWindow):
 
         # Register data providers for autosave
         self.autosave_manager.register_data_provider(
-            "table_data", self.get_table_data_for_autosave
+            "table_data",
+            self._cached_autosave_provider(
+                "table_data", self.get_table_data_for_autosave
+            ),
         )
         self.autosave_manager.register_data_provider(
-            "ui_state", self.get_ui_state_for_autosave
+            "ui_state",
+            self._cached_autosave_provider("ui_state", self.get_ui_state_for_autosave),
         )
         self.autosave_manager.register_data_provider(
-            "project_state", self.get_project_state_for_autosave
+            "project_state",
+            self._cached_autosave_provider(
+                "project_state", self.get_project_state_for_autosave
+            ),
         )
 
         # Start autosave if enabled
         if prefs.get("auto_save_enabled", True):
             self.autosave_manager.start()
 
+    def _cached_autosave_provider(self, name: str, build):
+        """Wrap an autosave provider so it only rebuilds when marked dirty"""
+
+        def provider():
+            if not self._autosave_dirty[name] and name in self._autosave_cache:
+                return self._autosave_cache[name]
+
+            data = build()
+            self._autosave_cache[name] = data
+            self._autosave_dirty[name] = False
+            return data
+
+        return provider
+
+    def _mark_autosave_dirty(self, *names: str):
+        """Flag autosave sections as changed and schedule an autosave"""
+        for name in names:
+            self._autosave_dirty[name] = True
+        self.autosave_manager.mark_dirty()
+
+    def _update_project(self, updates: dict):
+        """Apply project state changes and schedule a project autosave"""
+        self.project_manager.update_state(updates)
+        self._mark_autosave_dirty("project_state")
+
+    def _mark_ui_state_dirty(self, *args):
+        """Flag the autosaved UI state as changed"""
+        self._autosave_dirty["ui_state"] = True
+
     def get_table_data_for_autosave(self) -> dict:
         """Get table data for autosave"""
-        if not self.table_model or not hasattr(self.table_model, "get_dataframe"):
+        if not self.table_model:
             return {}
 
         try:
-            df = self.table_model.get_dataframe()
+            # Autosave runs on the UI thread and only serializes the frame
+            df = self.table_model.getDataFrameView()
             if df is not None and not df.empty:
                 return {
-                    "dataframe_json": df.to_json(orient="split", force_ascii=False),
-                    "current_file": (
-                        str(self.app_state.csv_files[self.app_state.current_file_index])
-                        if self.app_state.csv_files
-                        else ""
-                    ),
+                    **self._encode_dataframe_for_autosave(df),
+                    "current_file": self._current_file_str,
                     "file_index": self.app_state.current_file_index,
                 }
         except Exception as e:
@@ -523,16 +853,48 @@ class CSVTranslatorMainWindow(QMainWindow):
 
         return {}
 
+    @staticmethod
+    def _encode_dataframe_for_autosave(df) -> dict:
+        """Encode the table as base64 Feather, falling back to split JSON"""
+        try:
+            buffer = io.BytesIO()
+            df.to_feather(buffer)
+            return {
+                "dataframe_feather": base64.b64encode(buffer.getvalue()).decode("ascii")
+            }
+        except (ImportError, ValueError, TypeError):
+            # pyarrow not installed, or a frame Feather cannot store as-is
+            return {"dataframe_json": df.to_json(orient="split", force_ascii=False)}
+
     def get_ui_state_for_autosave(self) -> dict:
         """Get UI state for autosave"""
         try:
-            current_index = self.table_view.currentIndex()
-            selected_indexes = []
-            if self.table_view.selectionModel():
-                selected_indexes = [
-                    (idx.row(), idx.column())
-                    for idx in self.table_view.selectionModel().selectedIndexes()
-                ]
+            selection_model = self.table_view.selectionModel()
+            if selection_model is None:
+                return {"settings_visible": self.settings_visible}
+
+            current_index = selection_model.currentIndex()
+            if self._selected_cells is None:
+                # Count from the selection rectangles first so a select-all on
+                # a large sheet is stored as a sentinel, not one tuple per cell
+                selection = selection_model.selection()
+                cell_count = sum(r.height() * r.width() for r in selection)
+                if cell_count > _MAX_AUTOSAVE_SELECTION:
+                    self._selected_cells = ("all", cell_count)
+                else:
+                    self._selected_cells = [
+                        (idx.row(), idx.column())
+                        for idx in selection_model.selectedIndexes()
+                    ]
+            if self._col_widths is None:
+                self._col_widths = {
+                    i: self.table_view.columnWidth(i)
+                    for i in range(
+                        self.table_view.model().columnCount()
+                        if self.table_view.model()
+                        else 0
+                    )
+                }
 
             return {
                 "current_cell": (
@@ -540,20 +902,13 @@ class CSVTranslatorMainWindow(QMainWindow):
                     if current_index.isValid()
                     else None
                 ),
-                "selected_cells": selected_indexes,
+                "selected_cells": self._selected_cells,
                 "scroll_position": (
                     self.table_view.verticalScrollBar().value()
                     if self.table_view.verticalScrollBar()
                     else 0
                 ),
-                "column_widths": {
-                    i: self.table_view.columnWidth(i)
-                    for i in range(
-                        self.table_view.model().columnCount()
-                        if self.table_view.model()
-                        else 0
-                    )
-                },
+                "column_widths": dict(self._col_widths),
                 "settings_visible": self.settings_visible,
             }
         except Exception as e:
@@ -573,8 +928,13 @@ class CSVTranslatorMainWindow(QMainWindow):
         }
 
     def check_recovery_on_startup(self):
-        """Check for recovery data on startup"""
-        recovery_data = self.autosave_manager.check_for_recovery()
+        """Scan for recovery data on a worker thread"""
+        self._recovery_scanner = _RecoveryScanner(self.autosave_manager)
+        self._recovery_scanner.signals.finished.connect(self.on_recovery_scan_finished)
+        QThreadPool.globalInstance().start(self._recovery_scanner)
+
+    def on_recovery_scan_finished(self, recovery_data):
+        """Offer recovery if the scan found data, then load the last project"""
         if recovery_data:
             reply = QMessageBox.question(
                 self,
@@ -589,6 +949,9 @@ class CSVTranslatorMainWindow(QMainWindow):
             else:
                 self.autosave_manager.clear_recovery_data()
 
+        # Load last project if available
+        self.load_last_project()
+
     def recover_session(self, recovery_data: dict):
         """Recover session from autosave data"""
         try:
@@ -610,41 +973,48 @@ class CSVTranslatorMainWindow(QMainWindow):
                 )
                 self.app_state.chunk_size = project_state.get("chunk_size", 50)
                 self.app_state.sleep_time = project_state.get("sleep_time", 10)
+                self._autosave_dirty["project_state"] = True
 
                 # Update UI with recovered state
-                self.config_panel.set_input_directory(self.app_state.input_directory)
-                self.config_panel.set_output_directory(self.app_state.output_directory)
-                self.config_panel.set_history_file(self.app_state.history_file)
-                self.config_panel.set_current_model(self.app_state.current_model)
-                self.config_panel.set_target_column(
-                    self.app_state.current_target_column
-                )
-                self.config_panel.set_chunk_size(self.app_state.chunk_size)
-                self.config_panel.set_sleep_time(self.app_state.sleep_time)
+                self.apply_state_to_config_panel()
 
             # Recover table data
             if "table_data" in data:
                 table_data = data["table_data"]
+                df_feather = table_data.get("dataframe_feather")
                 df_json = table_data.get("dataframe_json")
-                if df_json:
+                if df_feather or df_json:
                     import pandas as pd
 
-                    df = pd.read_json(df_json, orient="split")
+                    if df_feather:
+                        df = pd.read_feather(io.BytesIO(base64.b64decode(df_feather)))
+                    else:
+                        # Autosaves written before Feather support
+                        df = pd.read_json(df_json, orient="split")
                     if self.table_model:
                         self.table_model.setDataFrame(df)
 
                     # Set file info
                     file_path = table_data.get("current_file", "")
                     if file_path:
+                        self._current_file_str = file_path
+                        self._current_file_name = Path(file_path).name
+                        file_index = table_data.get("file_index", 0)
                         self.action_panel.update_file_info(
-                            Path(file_path).name, table_data.get("file_index", 0) + 1, 1
+                            file_index,
+                            max(len(self.app_state.csv_files), file_index + 1),
+                            self._current_file_name,
                         )
 
             # Recover UI state
             if "ui_state" in data:
                 ui_state = data["ui_state"]
-                self.settings_visible = ui_state.get("settings_visible", True)
-                self.toggle_settings_panel() if not self.settings_visible else None
+                settings_visible = ui_state.get("settings_visible", True)
+                self.settings_visible = settings_visible
+                self.settings_container.setVisible(settings_visible)
+                self.toggle_settings_btn.setText(
+                    "🔧 Hide Settings" if settings_visible else "🔧 Show Settings"
+                )
 
                 # Restore scroll position
                 scroll_pos = ui_state.get("scroll_position", 0)
@@ -675,11 +1045,35 @@ class CSVTranslatorMainWindow(QMainWindow):
             except Exception as e:
                 self.log(f"Error loading last project: {e}")
 
+    def apply_state_to_config_panel(self):
+        """Push app state into the config panel without per-field signals"""
+        self.config_panel.apply_state(
+            self.app_state.input_directory,
+            self.app_state.output_directory,
+            self.app_state.history_file,
+            self.app_state.current_model,
+            self.app_state.current_target_column,
+            self.app_state.chunk_size,
+            self.app_state.sleep_time,
+        )
+
+    def on_config_state_applied(self):
+        """Handle a bulk config panel update"""
+        # The per-field slots were blocked, so sync the file manager here
+        if self.app_state.input_directory:
+            self._scan_input_directory()
+        if self.app_state.output_directory:
+            self.file_manager.set_output_directory(self.app_state.output_directory)
+        self._mark_autosave_dirty("project_state")
+        self.log("Configuration applied")
+
     def apply_project_state(self):
         """Apply project state to UI"""
         if not self.project_manager.is_valid_project():
             return
 
+        self._autosave_dirty["project_state"] = True
+
         # Apply project settings to app state
         self.app_state.input_directory = self.project_manager.get_state("input_dir", "")
         self.app_state.output_directory = self.project_manager.get_state(
@@ -697,18 +1091,12 @@ class CSVTranslatorMainWindow(QMainWindow):
 
         # Update FileManager with directories
         if self.app_state.input_directory:
-            self.file_manager.set_input_directory(self.app_state.input_directory)
+            self._scan_input_directory()
         if self.app_state.output_directory:
             self.file_manager.set_output_directory(self.app_state.output_directory)
 
         # Update UI controls
-        self.config_panel.set_input_directory(self.app_state.input_directory)
-        self.config_panel.set_output_directory(self.app_state.output_directory)
-        self.config_panel.set_history_file(self.app_state.history_file)
-        self.config_panel.set_current_model(self.app_state.current_model)
-        self.config_panel.set_target_column(self.app_state.current_target_column)
-        self.config_panel.set_chunk_size(self.app_state.chunk_size)
-        self.config_panel.set_sleep_time(self.app_state.sleep_time)
+        self.apply_state_to_config_panel()
 
         # Load files if input directory is set
         if self.app_state.input_directory:
@@ -718,7 +1106,7 @@ class CSVTranslatorMainWindow(QMainWindow):
             file_index = self.project_manager.get_state("open_file_index", 0)
             if 0 <= file_index < len(self.app_state.csv_files):
                 self.app_state.current_file_index = file_index
-                self.load_current_file()
+                self.load_current_file(use_project_frame=True)
 
                 # Restore scroll position
                 scroll_pos = self.project_manager.get_state("scroll_pos", 0)
@@ -757,10 +1145,29 @@ class CSVTranslatorMainWindow(QMainWindow):
 
         self.project_manager.update_state(updates)
 
+    def _project_frames(self) -> dict:
+        """Tables to store in the project file, keyed by source CSV path"""
+        if not self.table_model or not self._current_file_str:
+            return {}
+        # Only a table matching its last save is stored, so reopening never
+        # brings back edits that were not written out
+        if self.table_model.isModified():
+            return {}
+        df = self.table_model.getDataFrameView()
+        if df is None or df.empty:
+            return {}
+        return {self._current_file_str: df}
+
+    def _project_shadows(self) -> dict:
+        """Lowercase search shadows to store with the project tables"""
+        if not self.table_model or not self._current_file_str:
+            return {}
+        return {self._current_file_str: self.table_model.getSearchShadow()}
+
     def on_auto_saved(self, file_path: str):
         """Handle auto-save completion"""
         # Optionally show a brief status message
-        pass
+        self.status_dirty.emit()
 
     def on_recovery_available(self, file_path: str):
         """Handle recovery data availability"""
@@ -768,8 +1175,15 @@ class CSVTranslatorMainWindow(QMainWindow):
 
     def apply_theme(self, theme_name: str):
         """Apply theme to the application"""
+        # Re-applying the active stylesheet would re-polish every widget
+        if theme_name == self.app_state.current_theme and self.styleSheet():
+            return
+
         self.app_state.current_theme = theme_name
-        stylesheet = AppSettings.get_theme_style(theme_name)
+        stylesheet = self._theme_styles.get(theme_name)
+        if stylesheet is None:
+            stylesheet = AppSettings.get_theme_style(theme_name)
+            self._theme_styles[theme_name] = stylesheet
         self.setStyleSheet(stylesheet)
 
         # Update action panel theme button
@@ -789,6 +1203,7 @@ class CSVTranslatorMainWindow(QMainWindow):
         """Toggle visibility of settings panel"""
         self.settings_visible = not self.settings_visible
         self.settings_container.setVisible(self.settings_visible)
+        self._autosave_dirty["ui_state"] = True
 
         if self.settings_visible:
             self.toggle_settings_btn.setText("🔧 Hide Settings")
@@ -800,11 +1215,9 @@ class CSVTranslatorMainWindow(QMainWindow):
         """Handle input directory change"""
         self.app_state.input_directory = directory
         # Update FileManager
-        self.file_manager.set_input_directory(directory)
-        # Update project state
-        self.project_manager.set_state("input_dir", directory)
-        prefs.set("last_input_dir", directory)
-        self.autosave_manager.mark_dirty()
+        self._scan_input_directory()
+        self._update_project({"input_dir": directory})
+        self._queue_pref("last_input_dir", directory)
         self.log(f"Input directory changed to: {directory}")
 
     def on_output_directory_changed(self, directory: str):
@@ -812,72 +1225,111 @@ class CSVTranslatorMainWindow(QMainWindow):
         self.app_state.output_directory = directory
         # Update FileManager
         self.file_manager.set_output_directory(directory)
-        # Update project state
-        self.project_manager.set_state("output_dir", directory)
-        prefs.set("last_output_dir", directory)
-        self.autosave_manager.mark_dirty()
+        self._update_project({"output_dir": directory})
+        self._queue_pref("last_output_dir", directory)
         self.log(f"Output directory changed to: {directory}")
 
     def on_history_file_changed(self, file_path: str):
         """Handle history file change"""
         self.app_state.history_file = file_path
-        self.project_manager.set_state("history_file", file_path)
-        self.autosave_manager.mark_dirty()
+        self._update_project({"history_file": file_path})
         self.log(f"History file changed to: {file_path}")
 
     def on_model_changed(self, model_name: str):
         """Handle model selection change"""
         self.app_state.current_model = model_name
-        self.project_manager.set_state("model", model_name)
-        prefs.set("default_ai_model", model_name)
-        self.autosave_manager.mark_dirty()
+        self._update_project({"model": model_name})
+        self._queue_pref("default_ai_model", model_name)
         self.log(f"Model changed to: {model_name}")
 
     def on_sleep_time_changed(self, seconds: int):
         """Handle sleep time change"""
         self.app_state.sleep_time = seconds
-        self.project_manager.set_state("sleep_time", seconds)
-        prefs.set("default_sleep_time", seconds)
-        self.autosave_manager.mark_dirty()
+        self._update_project({"sleep_time": seconds})
+        self._queue_pref("default_sleep_time", seconds)
         self.log(f"Sleep time changed to: {seconds}s")
 
     def on_chunk_size_changed(self, size: int):
         """Handle chunk size change"""
         self.app_state.chunk_size = size
-        self.project_manager.set_state("chunk_size", size)
-        prefs.set("default_chunk_size", size)
-        self.autosave_manager.mark_dirty()
+        self._update_project({"chunk_size": size})
+        self._queue_pref("default_chunk_size", size)
         self.log(f"Chunk size changed to: {size} lines")
 
+    def _queue_pref(self, key: str, value):
+        """Record a preference change to be written on the next flush"""
+        self._pending_prefs[key] = value
+        self._pref_timer.start()
+
+    def _flush_prefs(self):
+        """Write all pending preference changes"""
+        self._pref_timer.stop()
+        pending, self._pending_prefs = self._pending_prefs, {}
+        for key, value in pending.items():
+            prefs.set(key, value)
+
     def on_cell_clicked(self, index):
         """Handle cell click in table"""
+        # Write any pending detail edit to the cell it was made for
+        if self._cell_detail_timer.isActive():
+            self._cell_detail_timer.stop()
+            self._commit_cell_detail()
+
         if index.isValid():
             value = self.table_model.data(index, Qt.ItemDataRole.DisplayRole)
-            self.cell_detail_text.setText(str(value) if value else "")
+            # Showing the cell is not an edit; keep textChanged from writing
+            # the same value straight back into the model
+            with QSignalBlocker(self.cell_detail_text):
+                self.cell_detail_text.setText(str(value) if value else "")
 
     def on_selection_changed(self, selected, deselected):
         """Handle table selection change"""
+        self._selected_cells = None
+        self._autosave_dirty["ui_state"] = True
         if self.table_model:
             indexes = self.table_view.selectionModel().selectedIndexes()
             self.table_model.updateSelection(indexes)
 
     def on_data_edited(self, row, col, old_value, new_value):
         """Handle data editing in table"""
+        self._mark_autosave_dirty("table_data")
         self.log(f"Cell ({row+1}, {col+1}) changed from '{old_value}' to '{new_value}'")
 
+    def on_column_values_edited(self, col, count):
+        """Handle a batch write into one column"""
+        self._mark_autosave_dirty("table_data")
+        self.log(f"{count} cells updated in column {col+1}")
+
     def on_cell_detail_modified(self):
         """Handle cell detail text modification"""
-        current_index = self.table_view.currentIndex()
-        if current_index.isValid() and self.table_model:
+        self._cell_detail_index = QPersistentModelIndex(self.table_view.currentIndex())
+        self._cell_detail_timer.start()
+
+    def _commit_cell_detail(self):
+        """Write the cell detail text back to the cell it was edited for"""
+        if self._cell_detail_index.isValid() and self.table_model:
             new_value = self.cell_detail_text.toPlainText()
-            self.table_model.setData(current_index, new_value)
+            self.table_model.setData(QModelIndex(self._cell_detail_index), new_value)
 
     def on_target_column_changed(self, column: str):
         """Handle target column change"""
         self.app_state.current_target_column = column
+        self._mark_autosave_dirty("project_state")
         self.log(f"Target column changed to: {column}")
 
     # File management methods
+    def _scan_input_directory(self) -> bool:
+        """Point the file manager at the input directory unless already scanned"""
+        directory = self.app_state.input_directory
+        if (
+            self._scanned_input_dir == directory
+            and self.file_manager.input_directory == directory
+        ):
+            return True
+        success = self.file_manager.set_input_directory(directory)
+        self._scanned_input_dir = directory if success else None
+        return success
+
     def load_files(self):
         """Load CSV files from input directory"""
         if not self.app_state.input_directory:
@@ -887,10 +1339,10 @@ class CSVTranslatorMainWindow(QMainWindow):
             return
 
         try:
-            # Set input directory and get CSV files
-            success = self.file_manager.set_input_directory(
-                self.app_state.input_directory
-            )
+            # Set input directory and get CSV files, reusing a scan made since
+            # the last load; the next load rescans so new files are picked up
+            success = self._scan_input_directory()
+            self._scanned_input_dir = None
             if not success:
                 self.log("Failed to set input directory")
                 QMessageBox.critical(self, "Error", "Failed to access input directory.")
@@ -898,13 +1350,8 @@ class CSVTranslatorMainWindow(QMainWindow):
 
             # Auto-generate and set history file path
             if self.app_state.csv_files:
-                current_file = self.app_state.csv_files[
-                    self.app_state.current_file_index
-                ]
-                file_name = (
-                    current_file.name
-                    if hasattr(current_file, "name")
-                    else Path(current_file).name
+                file_name = os.path.basename(
+                    self.app_state.csv_files[self.app_state.current_file_index]
                 )
                 history_path = self.file_manager.ensure_history_file(file_name)
                 if history_path:
@@ -914,10 +1361,10 @@ class CSVTranslatorMainWindow(QMainWindow):
 
             file_count = self.file_manager.get_file_count()
             if file_count > 0:
-                # Update app state with Path objects
-                csv_files = self.file_manager.csv_files
+                # Update app state with absolute path strings
+                input_dir = self.app_state.input_directory
                 self.app_state.csv_files = [
-                    Path(self.app_state.input_directory) / f for f in csv_files
+                    os.path.join(input_dir, f) for f in self.file_manager.csv_files
                 ]
                 self.app_state.current_file_index = 0
 
@@ -933,23 +1380,40 @@ class CSVTranslatorMainWindow(QMainWindow):
             self.log(f"Error loading files: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to load files: {str(e)}")
 
-    def load_current_file(self):
+    def load_current_file(self, use_project_frame: bool = False):
         """Load the current file into the table"""
         if not self.app_state.csv_files or self.app_state.current_file_index < 0:
             return
 
         try:
-            # Use FileManager to load file by index
-            df = self.file_manager.load_file(self.app_state.current_file_index)
+            current_file = self.app_state.csv_files[self.app_state.current_file_index]
+            df = None
+            if use_project_frame:
+                # Table stored in the project file, skipping the CSV parse
+                df = self.project_manager.load_frame(current_file)
+                use_project_frame = df is not None
+                if use_project_frame:
+                    self.file_manager.current_file_index = (
+                        self.app_state.current_file_index
+                    )
+                    self.file_manager.current_dataframe = df
+            if df is None:
+                # Use FileManager to load file by index
+                df = self.file_manager.load_file(self.app_state.current_file_index)
             if df is None:
                 self.log("Failed to load file")
                 return
 
             self.table_model.setDataFrame(df)
+            if use_project_frame:
+                # The shadow was saved from this same table
+                shadow = self.project_manager.load_shadow(current_file)
+                if shadow is not None:
+                    self.table_model.setSearchShadow(shadow)
 
             # Update UI
-            current_file = self.app_state.csv_files[self.app_state.current_file_index]
-            filename = current_file.name
+            self._current_file_str = current_file
+            self._current_file_name = filename = os.path.basename(current_file)
             self.action_panel.update_file_info(
                 self.app_state.current_file_index,
                 len(self.app_state.csv_files),
@@ -989,8 +1453,15 @@ class CSVTranslatorMainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "No file selected.")
             return
 
+        if self._save_runnable is not None:
+            self.log("A save is already in progress")
+            return
+
+        # Get current file info
+        filename = self.app_state.csv_files[self.app_state.current_file_index]
+
         try:
-            # Get DataFrame from table model
+            # Get DataFrame from table model (a copy, safe to hand to the worker)
             df = self.table_model.getDataFrame()
 
             # Validate we have data
@@ -1020,98 +1491,54 @@ class CSVTranslatorMainWindow(QMainWindow):
                     )
                     return
 
-            # Use FileManager to save file by index
-            success = self.file_manager.save_file_by_index(
-                self.app_state.current_file_index, df
+            # Save into the output directory on the thread pool
+            self._save_filename = filename
+            output_path = os.path.join(
+                self.app_state.output_directory, os.path.basename(filename)
             )
+            self._save_runnable = _SaveRunnable(
+                self.file_manager.save_file, output_path, df
+            )
+            self._save_runnable.signals.finished.connect(self.on_save_finished)
+            QThreadPool.globalInstance().start(self._save_runnable)
+            self.log(f"Saving {filename}...")
 
-            if success:
-                # Reset modified state
-                self.table_model.resetModified()
-
-                # Get current file info
-                current_file = self.app_state.csv_files[
-                    self.app_state.current_file_index
-                ]
-                filename = (
-                    current_file if isinstance(current_file, str) else str(current_file)
-                )
-
-                # Update project state if we have a project
-                if self.project_manager.current_path:
-                    self.project_manager.add_processed_file(filename, success=True)
-                    self.capture_state_into_project()
-
-                # Mark autosave as dirty to save the new state
-                self.autosave_manager.mark_dirty()
-
-                self.log(f"Saved changes to: {filename}")
-                QMessageBox.information(self, "Success", "Changes saved successfully.")
+        except Exception as e:
+            self._save_filename = filename
+            self.on_save_finished(False, str(e))
 
-            else:
-                # Try to get more detailed error information
-                error_details = ""
+    def on_save_finished(self, success: bool, error: str):
+        """Handle the result of a background save"""
+        self._save_runnable = None
+        filename = self._save_filename
 
-                # Check if file is writable
-                current_file = self.app_state.csv_files[
-                    self.app_state.current_file_index
-                ]
-                filename = (
-                    current_file if isinstance(current_file, str) else str(current_file)
-                )
-                output_path = os.path.join(
-                    self.app_state.output_directory, f"translated_{filename}"
-                )
-
-                if os.path.exists(output_path):
-                    if not os.access(output_path, os.W_OK):
-                        error_details = "File is write-protected or being used by another application."
-                else:
-                    if not os.access(self.app_state.output_directory, os.W_OK):
-                        error_details = "No write permission to output directory."
+        if success:
+            # Reset modified state
+            self.table_model.resetModified()
 
-                # Update project state to mark as failed
-                if self.project_manager.current_path:
-                    self.project_manager.add_processed_file(filename, success=False)
+            # Update project state if we have a project
+            if self.project_manager.current_path:
+                self.project_manager.add_processed_file(filename, success=True)
+                self.capture_state_into_project()
 
-                self.log(f"Failed to save file: {filename}. {error_details}")
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    (
-                        f"Failed to save file.\n\n{error_details}"
-                        if error_details
-                        else "Failed to save file."
-                    ),
-                )
+            # Mark autosave as dirty to save the new state
+            self.autosave_manager.mark_dirty()
 
-        except Exception as e:
-            # Get current file info for error logging
-            filename = "Unknown"
-            try:
-                if self.app_state.csv_files and self.app_state.current_file_index >= 0:
-                    current_file = self.app_state.csv_files[
-                        self.app_state.current_file_index
-                    ]
-                    filename = (
-                        current_file
-                        if isinstance(current_file, str)
-                        else str(current_file)
-                    )
-            except:
-                pass
-
-            # Update project state to mark as failed
-            if self.project_manager.current_path:
-                self.project_manager.add_processed_file(filename, success=False)
+            self.log(f"Saved changes to: {filename}")
+            QMessageBox.information(self, "Success", "Changes saved successfully.")
+            return
 
-            self.log(f"Error saving file {filename}: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
+        # Update project state to mark as failed
+        if self.project_manager.current_path:
+            self.project_manager.add_processed_file(filename, success=False)
 
-            # Print traceback for debugging
-            import traceback
+        if error:
+            self.log(f"Error saving file {filename}: {error}")
+            QMessageBox.critical(self, "Error", f"Failed to save file: {error}")
+            return
 
-            print(f"Save error traceback:\n{traceback.format_exc()}")
+        self.log(f"Failed to save file: {filename}")
+        QMessageBox.critical(self, "Error", "Failed to save file.")
 
     # Translation methods
     def translate_current_file(self):
@@ -1127,7 +1554,8 @@ class CSVTranslatorMainWindow(QMainWindow):
         sleep_time = self.config_panel.get_sleep_time()
 
         # Check if target column exists
-        column_names = list(self.table_model.getDataFrame().columns)
+        df = self.table_model.getDataFrameView()
+        column_names = list(df.columns)
         if target_column not in column_names:
             self.log(f"Error: Target column '{target_column}' not found in CSV")
             QMessageBox.warning(
@@ -1155,23 +1583,19 @@ class CSVTranslatorMainWindow(QMainWindow):
             f"Starting translation to '{target_column}' column using model: {model_name}"
         )
 
-        # Get original texts for translation
-        original_texts = []
-        for row in range(self.table_model.rowCount()):
-            text = str(self.table_model.getDataFrame().iloc[row, original_col_index])
-            if text and text.strip() and text != "nan":
-                original_texts.append(text.strip())
-            else:
-                original_texts.append("")
-
-        # Filter out empty texts and create mapping
-        texts_to_translate = []
-        row_mapping = []  # Maps text index to row index
+        # Get original texts for translation, skipping empty and NaN cells
+        # Text columns are stripped as-is (NaN and non-string cells come back
+        # as NaN); only non-object columns need a str conversion first
+        raw_texts = df.iloc[:, original_col_index]
+        if raw_texts.dtype != object:
+            raw_texts = raw_texts.astype(str)
+        stripped_texts = raw_texts.str.strip()
+        has_text = (
+            (stripped_texts.fillna("") != "") & (raw_texts != "nan")
+        ).to_numpy()
 
-        for i, text in enumerate(original_texts):
-            if text and text.strip():
-                texts_to_translate.append(text)
-                row_mapping.append(i)
+        texts_to_translate = stripped_texts[has_text].tolist()
+        row_mapping = np.flatnonzero(has_text).tolist()  # text index -> row index
 
         if not texts_to_translate:
             self.log("No text to translate found")
@@ -1181,30 +1605,24 @@ class CSVTranslatorMainWindow(QMainWindow):
             return
 
         # Create translation chunks
-        chunks = []
-        chunk_id = 0
-        for i in range(0, len(texts_to_translate), chunk_size):
-            end_idx = min(i + chunk_size, len(texts_to_translate))
-            chunk_texts = texts_to_translate[i:end_idx]
-
-            chunk = TranslationChunk(
+        text_count = len(texts_to_translate)
+        chunks = [
+            TranslationChunk(
                 chunk_id=chunk_id,
-                original_texts=chunk_texts,
+                original_texts=texts_to_translate[i : i + chunk_size],
                 start_row=i,
-                end_row=end_idx - 1,
+                end_row=min(i + chunk_size, text_count) - 1,
                 target_column=target_column,
             )
-            chunks.append(chunk)
-            chunk_id += 1
+            for chunk_id, i in enumerate(range(0, text_count, chunk_size))
+        ]
 
         # Determine model provider based on model name
-        model_provider = self.app_state.current_model_provider
-        if "gpt" in model_name.lower() or "openai" in model_name.lower():
-            model_provider = ModelProvider.OPENAI
-        elif "claude" in model_name.lower() or "anthropic" in model_name.lower():
-            model_provider = ModelProvider.ANTHROPIC
-        else:
-            model_provider = ModelProvider.GOOGLE
+        lowered_name = model_name.lower()
+        model_provider = next(
+            (p for kw, p in _PROVIDER_KEYWORDS if kw in lowered_name),
+            ModelProvider.GOOGLE,
+        )
 
         # Create translation request
         request = TranslationRequest(
@@ -1231,6 +1649,9 @@ class CSVTranslatorMainWindow(QMainWindow):
                         f"Translating chunk {i + 1}/{total_chunks} ({len(chunk.original_texts)} texts)..."
                     )
 
+                    # Chunks start at most once per sleep_time interval
+                    deadline = time.monotonic() + sleep_time
+
                     # Translate the chunk
                     translated_chunk = self.translation_engine.translate_chunk(
                         chunk, request
@@ -1240,19 +1661,16 @@ class CSVTranslatorMainWindow(QMainWindow):
                         translated_chunk.status == "completed"
                         and translated_chunk.translated_texts
                     ):
-                        # Update the table model with translated texts
+                        # Hand the whole chunk to the GUI thread for the model
+                        rows, values = [], []
                         for j, translated_text in enumerate(
                             translated_chunk.translated_texts
                         ):
                             text_index = chunk.start_row + j
                             if text_index < len(row_mapping):
-                                row = row_mapping[text_index]
-                                if row < self.table_model.rowCount():
-                                    # Set the translated text in target column
-                                    index = self.table_model.index(
-                                        row, target_col_index
-                                    )
-                                    self.table_model.setData(index, translated_text)
+                                rows.append(row_mapping[text_index])
+                                values.append(translated_text)
+                        self.translationApplied.emit(target_col_index, rows, values)
 
                         # Add to history
                         self.history_manager.add_translation_entry(
@@ -1267,9 +1685,11 @@ class CSVTranslatorMainWindow(QMainWindow):
                         error_msg = translated_chunk.error_message or "Unknown error"
                         self.log(f"✗ Failed to translate chunk {i + 1}: {error_msg}")
 
-                    # Sleep between chunks
+                    # Sleep out whatever the request did not already use
                     if i < total_chunks - 1:
-                        time.sleep(sleep_time)
+                        remaining = deadline - time.monotonic()
+                        if remaining > 0:
+                            time.sleep(remaining)
 
                 self.log("🎉 Translation completed!")
 
@@ -1279,8 +1699,6 @@ class CSVTranslatorMainWindow(QMainWindow):
 
             except Exception as e:
                 self.log(f"Translation error: {e}")
-                import traceback
-
                 self.log(f"Full error: {traceback.format_exc()}")
 
         # Run translation in thread
@@ -1288,6 +1706,17 @@ class CSVTranslatorMainWindow(QMainWindow):
         thread.daemon = True
         thread.start()
 
+    def on_translation_applied(self, col: int, rows: list, values: list):
+        """Write a translated chunk into the table model"""
+        if not self.table_model:
+            return
+        row_count = self.table_model.rowCount()
+        if rows and max(rows) >= row_count:
+            kept = [(r, v) for r, v in zip(rows, values) if r < row_count]
+            rows = [r for r, _ in kept]
+            values = [v for _, v in kept]
+        self.table_model.setColumnValues(rows, col, values)
+
     def auto_translate_all(self):
         """Auto translate all files"""
         if not self.app_state.csv_files:
@@ -1312,124 +1741,193 @@ class CSVTranslatorMainWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        try:
-            self.action_panel.set_translation_in_progress(True)
-            self.action_panel.show_progress(True)
-
-            total_files = len(self.app_state.csv_files)
-            successful_files = 0
-            failed_files = 0
-
-            for file_index in range(total_files):
-                # Update progress
-                self.action_panel.update_progress(
-                    file_index,
-                    total_files,
-                    f"Translating file {file_index + 1}/{total_files}",
-                )
+        if not self.app_state.output_directory:
+            QMessageBox.warning(
+                self,
+                "Warning",
+                "No output directory specified. Please set an output directory first.",
+            )
+            return
 
-                # Load file
-                df = self.file_manager.load_file(file_index)
-                if df is None or df.empty:
-                    self.log(f"Skipping empty file {file_index + 1}")
-                    failed_files += 1
-                    continue
+        # Workers only see this snapshot, never app_state itself
+        csv_files = list(self.app_state.csv_files)
+        total_files = len(csv_files)
+        self.action_panel.set_translation_in_progress(True)
+        self.action_panel.show_progress(True)
+        self.action_panel.update_progress(
+            0, total_files, f"Translating {total_files} files"
+        )
 
-                filename = self.app_state.csv_files[file_index].name
-                self.log(f"Auto-translating file: {filename}")
+        threading.Thread(
+            target=self._run_auto_translate,
+            args=(
+                csv_files,
+                self.app_state.current_file_index,
+                self.app_state.chunk_size,
+                self.app_state.sleep_time,
+            ),
+            daemon=True,
+        ).start()
+
+    def _run_auto_translate(
+        self,
+        csv_files: List[str],
+        current_index: int,
+        chunk_size: int,
+        sleep_time: int,
+    ):
+        """Translate all files on a thread pool (runs off the UI thread)"""
+        total_files = len(csv_files)
+        successful_files = 0
+        failed_files = 0
+        current_was_translated = False
+        # Every file shares one provider, so one semaphore paces all requests
+        api_slots = threading.Semaphore(AppSettings.MAX_CONCURRENT_REQUESTS)
+        # FileManager keeps shared stats, so saves run one at a time
+        save_lock = threading.Lock()
 
-                # Find source column
-                source_column = df.columns[0] if len(df.columns) > 0 else None
-                if not source_column:
-                    self.log(f"No source column found in file: {filename}")
-                    failed_files += 1
-                    continue
+        try:
+            with ThreadPoolExecutor(
+                max_workers=AppSettings.AUTO_TRANSLATE_WORKERS
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._translate_file,
+                        file_path,
+                        chunk_size,
+                        sleep_time,
+                        api_slots,
+                        save_lock,
+                    ): file_index
+                    for file_index, file_path in enumerate(csv_files)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    success, filename = future.result()
+                    if success:
+                        successful_files += 1
+                        if futures[future] == current_index:
+                            current_was_translated = True
+                    else:
+                        failed_files += 1
+                    self._auto_translate_progress.emit(
+                        done, total_files, f"Translated {filename}"
+                    )
+        except Exception as e:
+            self.log(f"Auto-translation error: {str(e)}")
 
-                # Create or find target column
-                target_column = "Translation"
-                if target_column not in df.columns:
-                    df[target_column] = ""
+        self._auto_translate_finished.emit(
+            successful_files, failed_files, current_was_translated
+        )
 
-                try:
-                    # Prepare translation chunks
-                    chunks = self.file_manager.prepare_translation_chunks(
-                        df, source_column, self.app_state.chunk_size
-                    )
+    def _translate_file(
+        self,
+        file_path: str,
+        chunk_size: int,
+        sleep_time: int,
+        api_slots: threading.Semaphore,
+        save_lock: threading.Lock,
+    ):
+        """Translate and save one file; returns (success, filename)"""
+        filename = os.path.basename(file_path)
+        try:
+            # Load file; FileUtils keeps no state, unlike FileManager.load_file
+            df = FileUtils.load_csv_file(file_path)
+            if df is None or df.empty:
+                self.log(f"Skipping empty file {filename}")
+                return False, filename
 
-                    if not chunks:
-                        self.log(f"No text to translate in file: {filename}")
-                        failed_files += 1
-                        continue
+            self.log(f"Auto-translating file: {filename}")
 
-                    # Create translation request
-                    from models.data_structures import TranslationRequest, ModelProvider
+            # Find source column
+            source_column = df.columns[0] if len(df.columns) > 0 else None
+            if not source_column:
+                self.log(f"No source column found in file: {filename}")
+                return False, filename
 
-                    request = TranslationRequest(
-                        source_column=source_column,
-                        target_column=target_column,
-                        model_provider=ModelProvider.GOOGLE,
-                        chunk_size=self.app_state.chunk_size,
-                        sleep_time=self.app_state.sleep_time,
-                    )
+            # Create or find target column
+            target_column = "Translation"
+            if target_column not in df.columns:
+                df[target_column] = ""
 
-                    # Translate chunks
-                    translated_chunks = []
-                    for chunk in chunks:
-                        result_chunk = self.translation_engine.translate_chunk(
-                            chunk, request
-                        )
-                        translated_chunks.append(result_chunk)
+            # Prepare translation chunks
+            chunks = self.file_manager.prepare_optimized_translation_chunks(
+                df, source_column, chunk_size
+            )
 
-                        # Sleep between chunks to avoid rate limits
-                        time.sleep(self.app_state.sleep_time)
+            if not chunks:
+                self.log(f"No text to translate in file: {filename}")
+                return False, filename
 
-                    # Apply translations back to dataframe
-                    updated_df = self.file_manager.apply_translation_chunks(
-                        df, translated_chunks, target_column
-                    )
+            # Create translation request
+            request = TranslationRequest(
+                source_column=source_column,
+                target_column=target_column,
+                model_provider=ModelProvider.GOOGLE,
+                chunk_size=chunk_size,
+                sleep_time=sleep_time,
+            )
 
-                    # Save the file
-                    success = self.file_manager.save_file_by_index(
-                        file_index, updated_df
+            # Translate chunks; each slot is held until sleep_time has passed
+            # since its request started, so at most MAX_CONCURRENT_REQUESTS
+            # calls (one by default, as configured) are made per sleep_time
+            # window across all files
+            translated_chunks = []
+            for chunk in chunks:
+                with api_slots:
+                    deadline = time.monotonic() + sleep_time
+                    result_chunk = self.translation_engine.translate_chunk(
+                        chunk, request
                     )
-                    if success:
-                        successful_files += 1
-                        self.log(f"Successfully translated and saved: {filename}")
-                    else:
-                        failed_files += 1
-                        self.log(f"Failed to save translated file: {filename}")
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(remaining)
+                translated_chunks.append(result_chunk)
+
+            # Apply translations back to dataframe
+            updated_df = self.file_manager.apply_translation_chunks(
+                df, translated_chunks, target_column
+            )
 
-                except Exception as e:
-                    failed_files += 1
-                    self.log(f"Error translating file {filename}: {str(e)}")
+            # Save the file into the output directory
+            with save_lock:
+                success = self.file_manager.save_file(filename, updated_df)
+            if success:
+                self.log(f"Successfully translated and saved: {filename}")
+            else:
+                self.log(f"Failed to save translated file: {filename}")
+            return bool(success), filename
 
-            # Final results
-            self.action_panel.hide_progress()
-            self.action_panel.set_translation_in_progress(False)
+        except Exception as e:
+            self.log(f"Error translating file {filename}: {str(e)}")
+            return False, filename
 
-            # Reload current file if it was translated
-            if self.app_state.current_file_index >= 0:
-                self.load_current_file()
+    def on_auto_translate_progress(self, done: int, total: int, message: str):
+        """Update the progress bar as auto-translated files complete"""
+        self.action_panel.update_progress(done, total, message)
 
-            result_message = f"Auto-translation completed!\nSuccessful: {successful_files} files\nFailed: {failed_files} files"
-            self.log(result_message)
+    def on_auto_translate_finished(
+        self, successful_files: int, failed_files: int, current_was_translated: bool
+    ):
+        """Report the results of auto_translate_all"""
+        # Final results
+        self.action_panel.hide_progress()
+        self.action_panel.set_translation_in_progress(False)
 
-            if successful_files > 0:
-                QMessageBox.information(
-                    self, "Auto-Translation Complete", result_message
-                )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Auto-Translation Failed",
-                    "No files were successfully translated.",
-                )
+        # Reload current file only if it was translated and saved
+        if current_was_translated:
+            self.load_current_file()
 
-        except Exception as e:
-            self.log(f"Auto-translation error: {str(e)}")
-            self.action_panel.set_translation_in_progress(False)
-            self.action_panel.hide_progress()
-            QMessageBox.critical(self, "Error", f"Auto-translation failed: {str(e)}")
+        result_message = f"Auto-translation completed!\nSuccessful: {successful_files} files\nFailed: {failed_files} files"
+        self.log(result_message)
+
+        if successful_files > 0:
+            QMessageBox.information(self, "Auto-Translation Complete", result_message)
+        else:
+            QMessageBox.critical(
+                self,
+                "Auto-Translation Failed",
+                "No files were successfully translated.",
+            )
 
     def summarize_history(self):
         """Summarize translation history"""
@@ -1443,6 +1941,7 @@ class CSVTranslatorMainWindow(QMainWindow):
         """Undo last operation"""
         if self.table_model and self.table_model.canUndo():
             self.table_model.undo()
+            self._mark_autosave_dirty("table_data")
             self.log("Undid last action")
         else:
             self.log("Nothing to undo")
@@ -1451,6 +1950,7 @@ class CSVTranslatorMainWindow(QMainWindow):
         """Redo last undone operation"""
         if self.table_model and self.table_model.canRedo():
             self.table_model.redo()
+            self._mark_autosave_dirty("table_data")
             self.log("Redid last action")
         else:
             self.log("Nothing to redo")
@@ -1483,6 +1983,7 @@ class CSVTranslatorMainWindow(QMainWindow):
         if clipboard_data:
             clipboard = QApplication.clipboard()
             clipboard.setText(clipboard_data)
+            self._mark_autosave_dirty("table_data")
             self.log(f"Cut {len(selected_indexes)} cells to clipboard")
 
     def paste_data(self):
@@ -1502,6 +2003,7 @@ class CSVTranslatorMainWindow(QMainWindow):
 
         success = self.table_model.pasteData(start_row, start_col, text_data)
         if success:
+            self._mark_autosave_dirty("table_data")
             self.log(f"Pasted data at row {start_row + 1}, column {start_col + 1}")
         else:
             self.log("Failed to paste data")
@@ -1517,13 +2019,19 @@ class CSVTranslatorMainWindow(QMainWindow):
 
         success = self.table_model.deleteSelectedData(selected_indexes)
         if success:
+            self._mark_autosave_dirty("table_data")
             self.log(f"Deleted {len(selected_indexes)} cells")
 
     def show_find_dialog(self):
         """Show find and replace dialog"""
         if not self.find_dialog:
+            from ui.dialogs import FindReplaceDialog
+
             self.find_dialog = FindReplaceDialog(self)
             self.find_dialog.find_next_requested.connect(self.find_text)
+            self.find_dialog.replace_all_begin.connect(self.on_replace_all_begin)
+            self.find_dialog.replace_all_requested.connect(self.replace_all_text)
+            self.find_dialog.replace_all_end.connect(self.on_replace_all_end)
 
         self.find_dialog.show()
         self.find_dialog.raise_()
@@ -1543,12 +2051,38 @@ class CSVTranslatorMainWindow(QMainWindow):
             # Navigate to the first result
             first_result = results[0]
             index = self.table_model.index(first_result[0], first_result[1])
+            self.table_view.setUpdatesEnabled(False)
             self.table_view.setCurrentIndex(index)
             self.table_view.scrollTo(index)
+            self.table_view.setUpdatesEnabled(True)
         else:
             self.table_model.clearHighlights()
             self.log(f"No occurrences found for '{text}'")
 
+    def on_replace_all_begin(self):
+        """Suspend table repaints while a Replace All is applied"""
+        self.table_view.setUpdatesEnabled(False)
+
+    def replace_all_text(self, old_text, new_text, case_sensitive, whole_words):
+        """Replace all occurrences in the table.
+
+        Runs between replace_all_begin and replace_all_end, so the model's single
+        dataChanged is painted once when updates are re-enabled.
+        """
+        if not self.table_model:
+            return
+
+        count = self.table_model.replace(
+            old_text, new_text, case_sensitive, whole_words
+        )
+        if count:
+            self._mark_autosave_dirty("table_data")
+        self.log(f"Replaced {count} cell(s)")
+
+    def on_replace_all_end(self):
+        """Resume table repaints after a Replace All"""
+        self.table_view.setUpdatesEnabled(True)
+
     def on_custom_model_added(self, model):
         """Handle custom model addition"""
         self.app_state.add_custom_model(model)
@@ -1558,9 +2092,7 @@ class CSVTranslatorMainWindow(QMainWindow):
     def on_custom_model_removed(self, model_name: str):
         """Handle custom model removal"""
         # Remove from app state
-        self.app_state.custom_models = [
-            m for m in self.app_state.custom_models if m.model_name != model_name
-        ]
+        self.app_state.remove_custom_model(model_name)
         self.log(f"Removed custom model: {model_name}")
 
     def find_next(self):
@@ -1578,16 +2110,22 @@ class CSVTranslatorMainWindow(QMainWindow):
         if not self.table_model:
             return
 
-        # Get the index at the position
-        index = self.table_view.indexAt(position)
+        # The menu only depends on whether cells are selected, so each variant
+        # is built on first use and reused afterwards
+        has_selection = bool(self.table_view.selectionModel().hasSelection())
+        context_menu = self._context_menus.get(has_selection)
+        if context_menu is None:
+            context_menu = self._build_context_menu(has_selection)
+            self._context_menus[has_selection] = context_menu
 
-        # Create context menu
-        from PyQt6.QtWidgets import QMenu
+        # Show menu
+        context_menu.exec(self.table_view.mapToGlobal(position))
 
+    def _build_context_menu(self, has_selection: bool) -> QMenu:
+        """Create the table context menu for a selection state"""
         context_menu = QMenu(self)
 
         # Translation submenu (if rows are selected)
-        has_selection = bool(self.table_view.selectedIndexes())
         if has_selection:
             translate_menu = context_menu.addMenu("🌐 Translate Selected Rows")
 
@@ -1628,11 +2166,10 @@ class CSVTranslatorMainWindow(QMainWindow):
         find_action = context_menu.addAction("Find...")
         find_action.triggered.connect(self.show_find_dialog)
 
-        # Show menu
-        context_menu.exec(self.table_view.mapToGlobal(position))
+        return context_menu
 
     def update_status(self):
-        """Update status periodically"""
+        """Update status when status_dirty fires"""
         # Update undo/redo button states
         if self.table_model:
             can_undo = self.table_model.canUndo()
@@ -1695,7 +2232,9 @@ class CSVTranslatorMainWindow(QMainWindow):
 
         try:
             self.capture_state_into_project()
-            if self.project_manager.save():
+            if self.project_manager.save(
+                frames=self._project_frames(), shadows=self._project_shadows()
+            ):
                 self.log("Project saved successfully")
             else:
                 QMessageBox.critical(self, "Error", "Failed to save project")
@@ -1722,7 +2261,11 @@ class CSVTranslatorMainWindow(QMainWindow):
         if save_path:
             try:
                 self.capture_state_into_project()
-                if self.project_manager.save(save_path):
+                if self.project_manager.save(
+                    save_path,
+                    frames=self._project_frames(),
+                    shadows=self._project_shadows(),
+                ):
                     prefs.add_recent_project(save_path)
                     self.update_recent_projects_menu()
                     self.log(f"Project saved as: {Path(save_path).name}")
@@ -1745,40 +2288,68 @@ class CSVTranslatorMainWindow(QMainWindow):
                 else:
                     QMessageBox.critical(self, "Error", "Failed to load project file")
             else:
+                self._recent_exists_cache.pop(project_path, None)
+                self.update_recent_projects_menu()
                 QMessageBox.warning(self, "Warning", "Project file no longer exists")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open recent project: {e}")
 
+    def _recent_project_exists(self, project_path: str) -> bool:
+        """Check a recent project file, reusing checks younger than the TTL"""
+        now = time.monotonic()
+        cached = self._recent_exists_cache.get(project_path)
+        if cached is not None and now - cached[1] < _RECENT_EXISTS_TTL:
+            return cached[0]
+        exists = os.path.exists(project_path)
+        self._recent_exists_cache[project_path] = (exists, now)
+        return exists
+
+    def _on_recent_project_triggered(self, action: QAction):
+        """Open the project behind a recent projects menu entry"""
+        project_path = action.data()
+        if project_path:
+            self.open_recent_project(project_path)
+
     def update_recent_projects_menu(self):
-        """Update the recent projects menu"""
-        if not hasattr(self, "recent_projects_menu"):
+        """Mark the recent projects menu for rebuilding on its next show"""
+        self._recent_menu_stale = True
+
+    def _lazy_populate_recent(self):
+        """Rebuild the recent projects menu if the list changed since last show"""
+        if not self._recent_menu_stale:
             return
 
+        self._recent_menu_stale = False
+
         # Clear existing actions
         self.recent_projects_menu.clear()
 
         # Add recent projects
         recent_projects = prefs.get_recent_projects()
+        # Forget existence checks for paths that left the list
+        self._recent_exists_cache = {
+            path: entry
+            for path, entry in self._recent_exists_cache.items()
+            if path in recent_projects
+        }
+        # Actions are parented to the menu so clear() deletes them
+        menu = self.recent_projects_menu
         if recent_projects:
             for project_path in recent_projects:
-                if Path(project_path).exists():
-                    project_name = Path(project_path).stem
-                    action = QAction(project_name, self)
-                    action.triggered.connect(
-                        lambda checked, path=project_path: self.open_recent_project(
-                            path
-                        )
-                    )
-                    self.recent_projects_menu.addAction(action)
-
-            self.recent_projects_menu.addSeparator()
-            clear_action = QAction("Clear Recent Projects", self)
+                if self._recent_project_exists(project_path):
+                    # Opened through the menu's triggered signal via data()
+                    action = QAction(Path(project_path).stem, menu)
+                    action.setData(project_path)
+                    menu.addAction(action)
+
+            menu.addSeparator()
+            clear_action = QAction("Clear Recent Projects", menu)
             clear_action.triggered.connect(self.clear_recent_projects)
-            self.recent_projects_menu.addAction(clear_action)
+            menu.addAction(clear_action)
         else:
-            no_recent_action = QAction("No recent projects", self)
+            no_recent_action = QAction("No recent projects", menu)
             no_recent_action.setEnabled(False)
-            self.recent_projects_menu.addAction(no_recent_action)
+            menu.addAction(no_recent_action)
 
     def clear_recent_projects(self):
         """Clear the recent projects list"""
@@ -1798,7 +2369,7 @@ class CSVTranslatorMainWindow(QMainWindow):
 
             if service:
                 # Set in translation engine
-                if service.provider_type.value in [p.value for p in ModelProvider]:
+                if service.provider_type.value in _PROVIDER_VALUES:
                     provider = ModelProvider(service.provider_type.value)
                     self.translation_engine.set_api_key(provider, api_key)
                     self.app_state.api_keys[provider.value] = api_key
@@ -1835,15 +2406,17 @@ class CSVTranslatorMainWindow(QMainWindow):
 
     def translate_selected_rows(self, use_context: bool):
         """Translate selected rows with optional context"""
-        selected_indexes = self.table_view.selectionModel().selectedIndexes()
+        # Get unique selected rows from the selection ranges rather than one
+        # index per cell; partially selected rows still count
+        selection = self.table_view.selectionModel().selection()
+        selected_rows = sorted(
+            {row for r in selection for row in range(r.top(), r.bottom() + 1)}
+        )
 
-        if not selected_indexes:
+        if not selected_rows:
             QMessageBox.warning(self, "Warning", "No rows selected.")
             return
 
-        # Get unique selected rows
-        selected_rows = sorted(set(index.row() for index in selected_indexes))
-
         self.log(
             f"Translating {len(selected_rows)} selected rows (context: {use_context})..."
         )
@@ -1882,13 +2455,43 @@ class CSVTranslatorMainWindow(QMainWindow):
 
     def log(self, message: str):
         """Add message to status log"""
-        timestamp = time.strftime("%H:%M:%S")
+        now = int(time.time())
+        stamp = self._log_stamp
+        if stamp[0] != now:
+            # Single tuple assignment so worker threads never see a torn pair
+            stamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+            self._log_stamp = stamp
+        timestamp = stamp[1]
         formatted_message = f"[{timestamp}] {message}"
-        self.status_text.append(formatted_message)
+        self._log_buffer.append(formatted_message)
+        self._log_flush_requested.emit()
+        self.status_dirty.emit()
+
+    def _schedule_log_flush(self):
+        """Start the log flush window if it is not already running"""
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        """Append all buffered log lines to the status log at once"""
+        lines = []
+        while self._log_buffer:
+            lines.append(self._log_buffer.popleft())
+        if not lines:
+            return
+        text = "\n".join(lines)
+        if not self.status_text.document().isEmpty():
+            text = "\n" + text
+        self.status_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.status_text.insertPlainText(text)
+        self.status_text.ensureCursorVisible()
 
     def closeEvent(self, event):
         """Handle application close event"""
         try:
+            # Write any preference changes still waiting on the debounce
+            self._flush_prefs()
+
             # Save window geometry to preferences
             geometry = self.geometry()
             prefs.set_window_geometry(
@@ -1904,7 +2507,9 @@ class CSVTranslatorMainWindow(QMainWindow):
 
             # Save project if valid
             if self.project_manager.current_path:
-                self.project_manager.save()
+                self.project_manager.save(
+                    frames=self._project_frames(), shadows=self._project_shadows()
+                )
                 prefs.set("last_project_path", self.project_manager.current_path)
 
             # Stop auto-save
@@ -1953,11 +2558,8 @@ class CSVTranslatorMainWindow(QMainWindow):
             )
 
             # Current filename
-            current_path = self.app_state.csv_files[self.app_state.current_file_index]
-            file_name = (
-                current_path.name
-                if hasattr(current_path, "name")
-                else Path(current_path).name
+            file_name = os.path.basename(
+                self.app_state.csv_files[self.app_state.current_file_index]
             )
 
             success = self.history_manager.update_history_for_file(
@@ -1976,8 +2578,6 @@ class CSVTranslatorMainWindow(QMainWindow):
                 self.log("Failed to update chat history")
                 QMessageBox.critical(self, "Error", "Failed to update chat history.")
         except Exception as e:
-            import traceback
-
             self.log(f"Error saving chat history: {e}")
             print(traceback.format_exc())
             QMessageBox.critical(self, "Error", f"Error saving chat history: {e}")
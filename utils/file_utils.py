@@ -3,15 +3,68 @@ File utilities for CSV operations and data handling
 """
 
 import os
+import io
 import json
+from itertools import chain
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 import csv
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from models.data_structures import FileInfo
 from config.settings import AppSettings
 
+def _load_json_file(file_path: str):
+    """Read a JSON file, with orjson when available"""
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json_file(data, file_path: str):
+    """Write data as indented UTF-8 JSON, with orjson when available"""
+    if orjson is not None:
+        with open(file_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+        return
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+# Byte order marks checked before sniffing, longest first
+_BOM_ENCODINGS = (
+    (b"\xef\xbb\xbf", "utf-8-sig"),
+    (b"\xff\xfe", "utf-16"),
+    (b"\xfe\xff", "utf-16"),
+)
+
 
 class FileUtils:
     """Utilities for file operations"""
@@ -22,42 +75,104 @@ class FileUtils:
         if not os.path.exists(directory):
             return []
 
-        csv_files = []
-        for file in os.listdir(directory):
-            if file.lower().endswith(".csv"):
-                csv_files.append(file)
+        csv_files = list(FileUtils.iter_csv_files(directory))
+        csv_files.sort()
+        return csv_files
 
-        return sorted(csv_files)
+    @staticmethod
+    def iter_csv_files(directory: str) -> Iterator[str]:
+        """Yield the names of CSV files in a directory, unsorted"""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name[-4:].lower() == ".csv" and entry.is_file():
+                    yield entry.name
+
+    @staticmethod
+    def detect_encoding(file_path: str, sample_size: int = 65536) -> str:
+        """Guess a file's text encoding from a BOM or its first bytes
+
+        A negative sample_size sniffs the whole file.
+        """
+        with open(file_path, "rb") as f:
+            head = f.read(sample_size)
+
+        for bom, encoding in _BOM_ENCODINGS:
+            if head.startswith(bom):
+                return encoding
+
+        try:
+            head.decode("utf-8")
+            return "utf-8"
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off by the sample boundary is fine
+            if len(head) == sample_size and e.reason == "unexpected end of data":
+                return "utf-8"
+
+        if from_bytes is not None:
+            best = from_bytes(head).best()
+            if best is not None:
+                return best.encoding
+        return "latin-1"
 
     @staticmethod
     def load_csv_file(file_path: str, encoding: str = None) -> Optional[pd.DataFrame]:
         """Load a CSV file with error handling"""
-        if encoding is None:
-            encoding = AppSettings.DEFAULT_ENCODING
-
         try:
-            # Try different encodings if the default fails
-            encodings_to_try = [encoding, "utf-8", "latin-1", "cp1252"]
-
-            for enc in encodings_to_try:
-                try:
-                    df = pd.read_csv(file_path, encoding=enc)
-                    # Replace NaN values with empty strings to avoid "nan" display
-                    df = df.fillna("")
-                    return df
-                except UnicodeDecodeError:
-                    continue
-
-            # If all encodings fail, try with error handling
-            df = pd.read_csv(file_path, encoding="utf-8", errors="replace")
-            # Replace NaN values with empty strings
-            df = df.fillna("")
-            return df
+            detected = encoding is None
+            if detected:
+                encoding = FileUtils.detect_encoding(file_path)
+
+            try:
+                return FileUtils._parse_csv(file_path, encoding)
+            except UnicodeDecodeError:
+                if not detected:
+                    raise
+                # The sample decoded cleanly but a later byte does not;
+                # sniff the whole file once and parse again
+                encoding = FileUtils.detect_encoding(file_path, sample_size=-1)
+                return FileUtils._parse_csv(file_path, encoding)
 
         except Exception as e:
             print(f"Error loading CSV file {file_path}: {e}")
             return None
 
+    @staticmethod
+    def _parse_csv(file_path: str, encoding: str) -> pd.DataFrame:
+        """Parse a CSV file with PyArrow if available, else pandas"""
+        if pacsv is not None:
+            try:
+                return FileUtils._read_csv_arrow(file_path, encoding)
+            except pa.ArrowInvalid:
+                pass  # Fall back to the pandas parser
+
+        df = pd.read_csv(file_path, encoding=encoding)
+        # Replace NaN values with empty strings to avoid "nan" display
+        df = df.fillna("")
+        return df
+
+    @staticmethod
+    def _read_csv_arrow(file_path: str, encoding: str) -> pd.DataFrame:
+        """Parse a CSV file with PyArrow's multithreaded reader"""
+        # Read every column as text: Arrow would otherwise infer booleans
+        # and dates that pandas leaves alone, and to_csv would then write
+        # them back in a different form ("true" -> "True")
+        with open(file_path, "r", encoding=encoding, newline="") as f:
+            header = next(csv.reader(f), [])
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(encoding=encoding),
+            # Empty text cells stay "" instead of becoming NaN
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False,
+            ),
+        )
+        df = table.to_pandas()
+        # Only non-text columns can still hold nulls
+        if any(column.null_count for column in table.columns):
+            df = df.fillna("")
+        return df
+
     @staticmethod
     def save_csv_file(
         dataframe: pd.DataFrame, file_path: str, encoding: str = None
@@ -82,12 +197,25 @@ class FileUtils:
     def get_file_info(file_path: str) -> Optional[FileInfo]:
         """Get information about a CSV file"""
         try:
-            df = FileUtils.load_csv_file(file_path)
-            if df is None:
-                return None
+            # Read the header row and count lines without parsing the body;
+            # quoted fields spanning several lines are counted once per line
+            encoding = FileUtils.detect_encoding(file_path)
+            with open(file_path, "rb") as f:
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size == 0:
+                    return None
+                line_count = 0
+                block = b""
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    line_count += block.count(b"\n")
+                if not block.endswith(b"\n"):
+                    line_count += 1
+                f.seek(0)
+                header = io.TextIOWrapper(f, encoding=encoding, newline="")
+                columns = next(csv.reader(header), [])
+                header.detach()
 
             file_name = os.path.basename(file_path)
-            columns = df.columns.tolist()
 
             # Check for translation-related columns
             has_original_text = "Original Text" in columns
@@ -102,18 +230,38 @@ class FileUtils:
             return FileInfo(
                 file_path=file_path,
                 file_name=file_name,
-                row_count=len(df),
-                column_count=len(df.columns),
+                row_count=max(line_count - 1, 0),
+                column_count=len(columns),
                 columns=columns,
                 has_original_text=has_original_text,
                 has_translation=has_translation,
                 translation_columns=translation_columns,
+                file_size=file_size,
+                encoding=encoding,
             )
 
         except Exception as e:
             print(f"Error getting file info for {file_path}: {e}")
             return None
 
+    @staticmethod
+    def _copy_file_range(src_path: str, dst_path: str) -> bool:
+        """Copy file contents in the kernel (a CoW clone where supported)"""
+        if not hasattr(os, "copy_file_range"):
+            return False
+        try:
+            with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return remaining <= 0
+        except OSError:
+            # e.g. cross-filesystem copies on older kernels
+            return False
+
     @staticmethod
     def backup_file(file_path: str, backup_dir: str = None) -> Optional[str]:
         """Create a backup of a file"""
@@ -134,7 +282,10 @@ class FileUtils:
             # Copy file
             import shutil
 
-            shutil.copy2(file_path, backup_path)
+            if not FileUtils._copy_file_range(file_path, backup_path):
+                # shutil already uses os.sendfile for this on Linux
+                shutil.copyfile(file_path, backup_path)
+            shutil.copystat(file_path, backup_path)
 
             return backup_path
 
@@ -155,22 +306,23 @@ class CSVConverter:
             return []
 
         # Convert to string and handle NaN/empty values
-        texts = dataframe[column].fillna("").astype(str).tolist()
+        texts = dataframe[column].fillna("").astype(str)
+        stripped = texts.str.strip()
+
+        # Skip empty or "nan" entries
+        mask = ((stripped != "") & (texts.str.lower() != "nan")).to_numpy()
+        lines = (np.flatnonzero(mask) + 1).tolist()
 
         # Create list of dictionaries with line numbers
-        json_data = []
-        for i, text in enumerate(texts):
-            # Skip empty or "nan" entries
-            if text and text.strip() and text.lower() != "nan":
-                json_data.append({"line": i + 1, "text": text.strip()})
+        json_data = [
+            {"line": line, "text": text}
+            for line, text in zip(lines, stripped[mask].tolist())
+        ]
 
         # Split into chunks
-        chunks = []
-        for i in range(0, len(json_data), chunk_size):
-            chunk = json_data[i : i + chunk_size]
-            chunks.append(chunk)
-
-        return chunks
+        return [
+            json_data[i : i + chunk_size] for i in range(0, len(json_data), chunk_size)
+        ]
 
     @staticmethod
     def json_chunks_to_csv(
@@ -182,40 +334,41 @@ class CSVConverter:
         # Initialize the column with empty strings
         result_df[column] = ""
 
-        # Process all chunks
-        for chunk in chunks:
-            for item in chunk:
-                if isinstance(item, dict) and "line" in item and "text" in item:
-                    line_num = item["line"] - 1  # Convert to 0-based index
-                    if 0 <= line_num < len(result_df):
-                        result_df.iloc[line_num, result_df.columns.get_loc(column)] = (
-                            item["text"]
-                        )
+        # Collect all (0-based line, text) pairs, then write them in one go
+        row_count = len(result_df)
+        items = [
+            (item["line"] - 1, item["text"])
+            for item in chain.from_iterable(chunks)
+            if isinstance(item, dict) and "line" in item and "text" in item
+        ]
+        items = [(line, text) for line, text in items if 0 <= line < row_count]
+        if items:
+            values = result_df[column].to_numpy(dtype=object, copy=True)
+            lines, texts = zip(*items)
+            # Later chunks win for duplicate lines, as with per-item writes
+            values[np.fromiter(lines, dtype=np.int64, count=len(lines))] = np.array(
+                texts, dtype=object
+            )
+            result_df[column] = values
 
         return result_df
 
-    @staticmethod
-    def create_translation_request_json(
-        chunk_data: List[Dict[str, any]],
-    ) -> Dict[str, any]:
-        """Create the JSON request format for LLM translation"""
-        return chunk_data  # Input format: [{"line": 1, "text": "..."}, ...]
-
     @staticmethod
     def parse_translation_response_json(response_json: str) -> List[Dict[str, any]]:
-        """Parse LLM response JSON format"""
+        """Parse LLM response JSON format (str, bytes or already-parsed data)"""
         try:
-            import json
-
-            response_data = (
-                json.loads(response_json)
-                if isinstance(response_json, str)
-                else response_json
-            )
+            if isinstance(response_json, (str, bytes)):
+                response_data = (
+                    orjson.loads(response_json)
+                    if orjson is not None
+                    else json.loads(response_json)
+                )
+            else:
+                response_data = response_json
 
             # Expected format: {"translation": [{"line": 1, "text": "..."}, ...]}
-            if isinstance(response_data, dict) and "translation" in response_data:
-                return response_data["translation"]
+            if isinstance(response_data, dict):
+                return response_data.get("translation", [])
 
             # Fallback: if it's already in the expected array format
             if isinstance(response_data, list):
@@ -240,8 +393,7 @@ class CSVConverter:
                 # Export all data
                 export_data = dataframe.to_dict("records")
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            _dump_json_file(export_data, file_path)
 
             return True
 
@@ -253,8 +405,7 @@ class CSVConverter:
     def import_from_json(file_path: str) -> Optional[pd.DataFrame]:
         """Import DataFrame from JSON file"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json_file(file_path)
 
             df = pd.DataFrame(data)
             return df
@@ -273,8 +424,7 @@ class ConfigManager:
         try:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            _dump_json_file(config_data, file_path)
 
             return True
 
@@ -289,8 +439,7 @@ class ConfigManager:
             if not os.path.exists(file_path):
                 return None
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            config_data = _load_json_file(file_path)
 
             return config_data
 